@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Benchmark for sync-hooks.py
+
+Generates synthetic hook trees of increasing size and times HookSyncer.sync_hooks
+for a cold sync, a no-op re-sync and a partial-change re-sync under each method.
+The partial scenario swaps in same-size files with new inodes and mtimes, so
+it times the hash-on-stat-miss compare and relink paths.
+Results are written as JSON so runs can be compared for regressions.
+
+Usage:
+    python scripts/bench-sync-hooks.py
+    python scripts/bench-sync-hooks.py --sizes=10,1000 --methods=copy --output=bench.json
+    python scripts/bench-sync-hooks.py --baseline=bench.json --threshold=1.25
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import contextlib
+import importlib.util
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SIZES = [10, 100, 1000, 10000, 50000]
+DEFAULT_METHODS = ["symlink", "hardlink", "copy"]
+SCENARIOS = ["cold", "noop", "partial"]
+
+
+def load_sync_module():
+    """Import sync-hooks.py, whose file name is not a valid module name."""
+    spec = importlib.util.spec_from_file_location("sync_hooks", REPO_ROOT / "sync-hooks.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def generate_tree(hooks_dir: Path, file_count: int, rng: random.Random) -> List[Path]:
+    """
+    Create file_count hook files under hooks_dir, nested up to four levels
+    deep, with sizes spread log-uniformly between 64 bytes and 64 KiB.
+    """
+    dirs = [hooks_dir]
+    files = []
+    for index in range(file_count):
+        # Open a new subdirectory every ~20 files, under a random existing one
+        if index % 20 == 0 and index:
+            parent = rng.choice(dirs)
+            if len(parent.relative_to(hooks_dir).parts) < 4:
+                dirs.append(parent / f"pkg_{len(dirs)}")
+        directory = rng.choice(dirs)
+        directory.mkdir(parents=True, exist_ok=True)
+        size = int(64 * (1024 ** rng.random()))
+        path = directory / f"hook_{index}.py"
+        path.write_bytes(rng.randbytes(size) if hasattr(rng, "randbytes")
+                         else os.urandom(size))
+        files.append(path)
+    return files
+
+
+def modify_files(files: List[Path], fraction: float, rng: random.Random) -> int:
+    """
+    Replace a fraction of the files through a temp file and os.replace, so
+    each gets a new inode and mtime but keeps its size. Half get new bytes,
+    half the same bytes, so the re-sync has to hash every one of them and
+    re-link the changed ones rather than short-circuiting on size.
+    Returns how many files were replaced.
+    """
+    changed = rng.sample(files, max(1, int(len(files) * fraction)))
+    for index, path in enumerate(changed):
+        data = path.read_bytes()
+        if index % 2 == 0:
+            data = bytes(byte ^ 0xFF for byte in data)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    return len(changed)
+
+
+def time_sync(module, source_root: Path, target: Path, method: str) -> Dict[str, object]:
+    """Run one sync_hooks call and return its wall time, stats and phase metrics."""
+    syncer = module.HookSyncer(source_root)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        ok = syncer.sync_hooks(target, method)
+        elapsed = time.perf_counter() - start
+    return {"seconds": elapsed, "ok": ok, "stats": syncer.stats, "metrics": syncer.metrics}
+
+
+def run_case(module, workdir: Path, file_count: int, method: str,
+             repeat: int, change_fraction: float, seed: int) -> List[dict]:
+    """Time every scenario for one tree size and method, keeping the fastest of repeat runs."""
+    results = {scenario: [] for scenario in SCENARIOS}
+    for run in range(repeat):
+        case_dir = workdir / f"{method}-{file_count}-{run}"
+        source_root = case_dir / "source"
+        target = case_dir / "target"
+        hooks_dir = source_root / ".claude" / "hooks"
+        hooks_dir.mkdir(parents=True)
+        target.mkdir()
+        rng = random.Random(seed + run)
+        files = generate_tree(hooks_dir, file_count, rng)
+
+        results["cold"].append(time_sync(module, source_root, target, method))
+        results["noop"].append(time_sync(module, source_root, target, method))
+        changed = modify_files(files, change_fraction, rng)
+        partial = time_sync(module, source_root, target, method)
+        partial["changed_files"] = changed
+        results["partial"].append(partial)
+
+        shutil.rmtree(case_dir)
+
+    rows = []
+    for scenario, runs in results.items():
+        times = sorted(r["seconds"] for r in runs)
+        best = min(runs, key=lambda r: r["seconds"])
+        rows.append({
+            "files": file_count,
+            "method": method,
+            "scenario": scenario,
+            "min_seconds": times[0],
+            "median_seconds": times[len(times) // 2],
+            "files_per_second": file_count / times[0] if times[0] else None,
+            "ok": all(r["ok"] for r in runs),
+            "stats": best["stats"],
+            "metrics": best["metrics"],
+            **({"changed_files": best["changed_files"]} if "changed_files" in best else {})
+        })
+    return rows
+
+
+def compare_to_baseline(results: List[dict], baseline_path: Path, threshold: float) -> List[str]:
+    """List the cases that got slower than threshold times the baseline."""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {(r["files"], r["method"], r["scenario"]): r["min_seconds"]
+                for r in baseline.get("results", [])}
+    regressions = []
+    for row in results:
+        before = previous.get((row["files"], row["method"], row["scenario"]))
+        if before and row["min_seconds"] > before * threshold:
+            regressions.append(f"{row['method']} {row['scenario']} @ {row['files']} files: "
+                               f"{before:.4f}s -> {row['min_seconds']:.4f}s")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sync-hooks.py across tree sizes and methods")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                       help="Comma-separated tree sizes in files (default: %(default)s)")
+    parser.add_argument("--methods", default=",".join(DEFAULT_METHODS),
+                       help="Comma-separated sync methods (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3,
+                       help="Runs per case; the fastest is reported (default: 3)")
+    parser.add_argument("--change-fraction", type=float, default=0.1,
+                       help="Share of files modified for the partial re-sync (default: 0.1)")
+    parser.add_argument("--seed", type=int, default=1234,
+                       help="Seed for the synthetic trees (default: 1234)")
+    parser.add_argument("--workdir",
+                       help="Directory for the synthetic trees (default: a temporary directory)")
+    parser.add_argument("--output", "-o",
+                       help="Write JSON results to this file instead of stdout")
+    parser.add_argument("--baseline",
+                       help="Earlier JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                       help="Slowdown factor over the baseline that counts as a regression")
+
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    methods = [method for method in args.methods.split(",") if method]
+    module = load_sync_module()
+
+    with tempfile.TemporaryDirectory(prefix="bench-sync-hooks-", dir=args.workdir) as workdir:
+        results = []
+        for file_count in sizes:
+            for method in methods:
+                rows = run_case(module, Path(workdir), file_count, method,
+                                max(1, args.repeat), args.change_fraction, args.seed)
+                for row in rows:
+                    print(f"{method:>9} {row['scenario']:>8} {file_count:>6} files: "
+                          f"{row['min_seconds']:.4f}s", file=sys.stderr)
+                results.extend(rows)
+
+    document = {
+        "version": 1,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2)
+    else:
+        json.dump(document, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        regressions = compare_to_baseline(results, Path(args.baseline), args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
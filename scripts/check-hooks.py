@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Fast hook freshness check for SessionStart hooks
+
+Runs `sync-hooks.py --check` on the given projects. Importing sync-hooks.py
+(rather than running it as a script) lets Python cache its bytecode, so the
+check doesn't recompile the whole sync script on every session start.
+Exits 0 if the hooks are up to date, 1 if not.
+
+Usage:
+    python scripts/check-hooks.py <target_project_path> [...] [--verbose]
+    python scripts/check-hooks.py "$CLAUDE_PROJECT_DIR"
+"""
+
+import sys
+import importlib.util
+from pathlib import Path
+
+SYNC_SCRIPT = Path(__file__).resolve().parent.parent / "sync-hooks.py"
+
+
+def main() -> int:
+    spec = importlib.util.spec_from_file_location("sync_hooks", SYNC_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.main(["--check"] + sys.argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Regression checks for sync-hooks.py
+
+Each check builds a small source repository and target project in a
+temporary directory, runs HookSyncer against them and verifies that the
+target ends up right without anything being written through a link into
+the source tree or an old checkout.
+
+Usage:
+    python scripts/test-sync-hooks.py
+    python scripts/test-sync-hooks.py --verbose
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+import contextlib
+import importlib.util
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SOURCE_FILES = {
+    "h1.py": "print(1)\n",
+    "utils/u.py": "U = 1\n",
+    "utils/llm/a.py": "A = 1\n",
+}
+CHECKS = []
+
+
+def check(func):
+    """Register a regression check."""
+    CHECKS.append(func)
+    return func
+
+
+def load_sync_module():
+    """Import sync-hooks.py, whose file name is not a valid module name."""
+    spec = importlib.util.spec_from_file_location("sync_hooks", REPO_ROOT / "sync-hooks.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_source(root: Path) -> Path:
+    """Create a source repository with SOURCE_FILES under .claude/hooks."""
+    hooks = root / ".claude" / "hooks"
+    for rel, content in SOURCE_FILES.items():
+        (hooks / rel).parent.mkdir(parents=True, exist_ok=True)
+        (hooks / rel).write_text(content)
+    return root
+
+
+def make_target(root: Path) -> Path:
+    """Create an empty target project."""
+    root.mkdir(parents=True)
+    return root
+
+
+def quiet(call, *args, **kwargs):
+    """Run a syncer call with its output discarded."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        return call(*args, **kwargs)
+
+
+def expect(condition: bool, message: str):
+    if not condition:
+        raise AssertionError(message)
+
+
+def expect_synced(target: Path):
+    """Check that every target hook has the source content."""
+    for rel, content in SOURCE_FILES.items():
+        path = target / ".claude" / "hooks" / rel
+        expect(path.read_text() == content, f"{path} does not have the source content")
+
+
+@check
+def relink_replaces_stale_symlink(module, tmp: Path):
+    """A symlink into an old checkout is replaced, not written through, by --method=copy."""
+    source = make_source(tmp / "source")
+    target = make_target(tmp / "target")
+    old = tmp / "old-checkout"
+    old.mkdir()
+    (old / "h1.py").write_text("old\n")
+    hooks = target / ".claude" / "hooks"
+    hooks.mkdir(parents=True)
+    (hooks / "h1.py").symlink_to(old / "h1.py")
+
+    expect(quiet(module.HookSyncer(source).sync_hooks, target, "copy"), "sync failed")
+    expect((old / "h1.py").read_text() == "old\n", "copy wrote through a stale symlink")
+    expect(not (hooks / "h1.py").is_symlink(), "stale symlink was left in place")
+    expect_synced(target)
+
+
+@check
+def relink_replaces_foreign_hard_link(module, tmp: Path):
+    """A hard link to other content is replaced, not written through, by --method=copy."""
+    source = make_source(tmp / "source")
+    target = make_target(tmp / "target")
+    other = tmp / "other.py"
+    other.write_text("other\n")
+    hooks = target / ".claude" / "hooks"
+    hooks.mkdir(parents=True)
+    os.link(other, hooks / "h1.py")
+
+    expect(quiet(module.HookSyncer(source).sync_hooks, target, "copy"), "sync failed")
+    expect(other.read_text() == "other\n", "copy wrote through a hard link")
+    expect_synced(target)
+
+
+@check
+def copy_replaces_linked_source_dirs(module, tmp: Path):
+    """--method=copy on a --link-dirs target turns the directory links into real directories."""
+    source = make_source(tmp / "source")
+    target = make_target(tmp / "target")
+    (target / ".claude" / "hooks").mkdir(parents=True)
+    (target / ".claude" / "hooks" / "local.py").write_text("LOCAL = 1\n")
+    expect(quiet(module.HookSyncer(source).sync_hooks, target, "symlink", True), "link-dirs sync failed")
+    expect((target / ".claude" / "hooks" / "utils").is_symlink(), "utils/ was not linked")
+
+    expect(quiet(module.HookSyncer(source).sync_hooks, target, "copy"), "copy sync failed")
+    expect(not (target / ".claude" / "hooks" / "utils").is_symlink(), "utils/ link was left in place")
+    for rel in ("utils/u.py", "utils/llm/a.py"):
+        path = target / ".claude" / "hooks" / rel
+        expect(not path.is_symlink() and path.stat().st_nlink == 1, f"{rel} is not a copy")
+    expect(sorted(p.name for p in (source / ".claude" / "hooks").iterdir()) == ["h1.py", "utils"],
+           "copy wrote into the source")
+    expect_synced(target)
+
+
+@check
+def copy_replaces_linked_hooks_root(module, tmp: Path):
+    """--method=copy into a hooks directory that is linked into the source replaces the link."""
+    source = make_source(tmp / "source")
+    target = make_target(tmp / "target")
+    (target / ".claude").mkdir()
+    (target / ".claude" / "hooks").symlink_to(source / ".claude" / "hooks", target_is_directory=True)
+
+    expect(quiet(module.HookSyncer(source).sync_hooks, target, "copy"), "copy sync failed")
+    expect(not (target / ".claude" / "hooks").is_symlink(), "hooks link was left in place")
+    expect(not (source / ".claude" / "hooks" / module.MANIFEST_NAME).exists(),
+           "manifest was written into the source")
+    expect_synced(target)
+
+
+@check
+def copy_after_store_keeps_objects(module, tmp: Path):
+    """Switching a store-synced target to --method=copy leaves the shared objects intact."""
+    source = make_source(tmp / "source")
+    target = make_target(tmp / "target")
+    store = module.HookStore(tmp / "store")
+    expect(quiet(module.HookSyncer(source).sync_store, [target], store), "store sync failed")
+
+    (source / ".claude" / "hooks" / "h1.py").write_text("print(2)\n")
+    expect(quiet(module.HookSyncer(source).sync_hooks, target, "copy"), "copy sync failed")
+    for obj in (tmp / "store" / "objects").iterdir():
+        data = obj.read_text()
+        expect(data in SOURCE_FILES.values(), f"store object {obj.name} was overwritten with {data!r}")
+        expect(obj.stat().st_mode & 0o777 == 0o444, f"store object {obj.name} is no longer read-only")
+    expect((target / ".claude" / "hooks" / "h1.py").read_text() == "print(2)\n", "target not updated")
+
+
+@check
+def store_objects_keep_execute_bits(module, tmp: Path):
+    """Store objects, and the targets using them, are executable only if the source file is."""
+    source = make_source(tmp / "source")
+    (source / ".claude" / "hooks" / "h1.py").chmod(0o755)
+    target = make_target(tmp / "target")
+    store = module.HookStore(tmp / "store")
+    expect(quiet(module.HookSyncer(source).sync_store, [target], store), "store sync failed")
+    hooks = target / ".claude" / "hooks"
+    expect(hooks.joinpath("h1.py").stat().st_mode & 0o111, "executable hook lost its execute bits")
+    expect(not hooks.joinpath("utils", "u.py").stat().st_mode & 0o111, "plain hook was made executable")
+
+    # Same content, different mode: each mode gets its own object
+    (source / ".claude" / "hooks" / "h1.py").chmod(0o644)
+    expect(quiet(module.HookSyncer(source).sync_store, [target], store), "store sync failed")
+    expect(not hooks.joinpath("h1.py").stat().st_mode & 0o111, "execute bits were kept after chmod")
+
+
+@check
+def store_rollback_keeps_linked_source_dirs(module, tmp: Path):
+    """A store rollback on a --link-dirs target does not rewrite the source through the link."""
+    source = make_source(tmp / "source")
+    target = make_target(tmp / "target")
+    # A target-local file keeps the hooks directory itself from being linked
+    (target / ".claude" / "hooks").mkdir(parents=True)
+    (target / ".claude" / "hooks" / "local.py").write_text("LOCAL = 1\n")
+    store = module.HookStore(tmp / "store")
+    expect(quiet(module.HookSyncer(source).sync_store, [target], store), "store sync failed")
+    with store.locked():
+        old_version = next(iter(store.index["versions"]))
+    expect(quiet(module.HookSyncer(source).sync_hooks, target, "symlink", True), "link-dirs sync failed")
+    expect((target / ".claude" / "hooks" / "utils").is_symlink(), "utils/ was not linked")
+
+    edited = source / ".claude" / "hooks" / "utils" / "u.py"
+    edited.write_text("U = 2\n")
+    expect(quiet(module.HookSyncer(source).sync_store, [target], store, old_version), "rollback failed")
+    expect(edited.read_text() == "U = 2\n", "rollback rewrote the source through a directory link")
+    expect(edited.stat().st_mode & 0o777 != 0o444, "source file was replaced by a store object")
+    expect(not (target / ".claude" / "hooks" / "utils").is_symlink(), "utils/ link was left in place")
+    expect_synced(target)
+
+
+@check
+def store_sync_keeps_linked_hooks_root(module, tmp: Path):
+    """A store sync into a hooks directory that is linked into the source replaces the link."""
+    source = make_source(tmp / "source")
+    target = make_target(tmp / "target")
+    (target / ".claude").mkdir()
+    (target / ".claude" / "hooks").symlink_to(source / ".claude" / "hooks", target_is_directory=True)
+
+    store = module.HookStore(tmp / "store")
+    expect(quiet(module.HookSyncer(source).sync_store, [target], store), "store sync failed")
+    expect(not (target / ".claude" / "hooks").is_symlink(), "hooks link was left in place")
+    expect(not (source / ".claude" / "hooks" / module.MANIFEST_NAME).exists(),
+           "manifest was written into the source")
+    for rel in SOURCE_FILES:
+        st = (source / ".claude" / "hooks" / rel).stat()
+        expect(st.st_nlink == 1, f"source {rel} was replaced by a store object")
+    expect_synced(target)
+
+
+@check
+def bundle_sync_keeps_linked_source_dirs(module, tmp: Path):
+    """--from-bundle on a --link-dirs target does not rewrite the source through the link."""
+    source = make_source(tmp / "source")
+    target = make_target(tmp / "target")
+    bundle = tmp / "hooks.zip"
+    expect(quiet(module.HookSyncer(source).export_bundle, bundle), "export failed")
+    (target / ".claude" / "hooks").mkdir(parents=True)
+    (target / ".claude" / "hooks" / "local.py").write_text("LOCAL = 1\n")
+    expect(quiet(module.HookSyncer(source).sync_hooks, target, "symlink", True), "link-dirs sync failed")
+    expect((target / ".claude" / "hooks" / "utils").is_symlink(), "utils/ was not linked")
+
+    edited = source / ".claude" / "hooks" / "utils" / "u.py"
+    edited.write_text("U = 2\n")
+    expect(quiet(module.HookSyncer(source).sync_bundle, [target], bundle), "bundle sync failed")
+    expect(edited.read_text() == "U = 2\n", "bundle sync rewrote the source through a directory link")
+    expect(not (target / ".claude" / "hooks" / "utils").is_symlink(), "utils/ link was left in place")
+    expect_synced(target)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regression checks for sync-hooks.py")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                       help="Show the traceback of failed checks")
+    args = parser.parse_args()
+    module = load_sync_module()
+
+    failures = 0
+    for func in CHECKS:
+        with tempfile.TemporaryDirectory(prefix="test-sync-hooks-") as tmp:
+            try:
+                func(module, Path(tmp))
+            except Exception as e:
+                failures += 1
+                print(f"FAIL {func.__name__}: {e}")
+                if args.verbose:
+                    import traceback
+                    traceback.print_exc()
+                continue
+        print(f"ok   {func.__name__}")
+
+    print(f"{len(CHECKS) - failures}/{len(CHECKS)} checks passed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
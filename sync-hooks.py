@@ -3,23 +3,488 @@
 Cross-Platform Claude Code Hooks Synchronization Script
 
 Syncs hooks from this repository to target project directories using the best
-available method: symlinks > hard links > smart copying.
+available method: symlinks > hard links > reflinks/in-kernel copies > smart copying.
+
+A sync is planned from a single os.scandir walk of the source and target trees
+(create, relink, update, skip and prune actions) and the plan is then applied.
+Each target keeps a .claude/hooks/.sync-manifest recording the size, mtime_ns,
+inode and digest of synced files, so unchanged files are never re-hashed.
 
 Usage:
     python sync-hooks.py <target_project_path>
     python sync-hooks.py <target_project_path> --method=copy
-    python sync-hooks.py <target_project_path> --dry-run
+    python sync-hooks.py <target_project_path> --method=reflink
+    python sync-hooks.py <target_project_path> --dry-run > plan.json
+    python sync-hooks.py --apply-plan=plan.json
+    python sync-hooks.py <project_a> <project_b> ... --jobs=16
+    python sync-hooks.py --targets-file=projects.txt
+    python sync-hooks.py <target_project_path> --watch
+    python sync-hooks.py <target_project_path> --method=symlink --link-dirs
+    python sync-hooks.py <target_project_path> --method=store
+    python sync-hooks.py <target_project_path> --method=store --store-version=<version>
+    python sync-hooks.py --store-list
+    python sync-hooks.py --gc
+    python sync-hooks.py --export-bundle=hooks.zip
+    python sync-hooks.py <target_project_path> --from-bundle=hooks.zip
+    python sync-hooks.py <target_project_path> --check
+    python sync-hooks.py <target_project_path> --stats-json=stats.json --profile=sync.prof
 """
 
+from __future__ import annotations
+
+# Only cheap modules are imported here so that --check starts fast; ctypes,
+# shutil, hashlib, argparse, zipfile, cProfile and the thread pool are
+# imported by the code that needs them
 import os
 import sys
-import shutil
-import platform
-import argparse
-import hashlib
-import subprocess
+import time
+import stat
+import contextlib
+import json
+import threading
 from pathlib import Path
-from typing import List, Tuple, Optional
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    import cProfile
+    import zipfile
+    from typing import Dict, List, Set, Tuple, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Per-target record of file stats and digests, used to skip re-hashing
+MANIFEST_NAME = ".sync-manifest"
+MANIFEST_VERSION = 1
+
+# Format of the JSON plans written by --dry-run and read by --apply-plan
+PLAN_VERSION = 1
+
+# Longest a watch burst is collected, in debounce intervals, before syncing
+MAX_BURST_INTERVALS = 5
+
+# Same default as ThreadPoolExecutor: targets are I/O bound
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) + 4)
+
+# ioctl that makes the target share the source's extents (btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+# Map sync_file results to their stats counters
+RESULT_STATS = {
+    "symlink": "symlinked",
+    "hardlink": "hard_linked",
+    "clone": "cloned",
+    "copy_file_range": "range_copied",
+    "sendfile": "sendfile_copied",
+    "copy": "copied",
+    "link_dir": "dirs_linked",
+    "skip": "skipped",
+    "remove": "removed",
+    "error": "errors"
+}
+
+
+# Results of the reflink tier, in the order they are tried
+REFLINK_RESULTS = ("clone", "copy_file_range", "sendfile")
+
+# Results that wrote something to the target
+SYNCED_RESULTS = ("symlink", "hardlink", "link_dir") + REFLINK_RESULTS + ("copy",)
+
+# Target entries that never count as local overrides of a directory
+SYNC_BOOKKEEPING = (MANIFEST_NAME, MANIFEST_NAME + ".tmp")
+
+
+# Timed phases of a sync, reported as <phase>_seconds
+PHASES = ("discovery", "compare", "link", "copy", "prune")
+
+# Format of the --stats-json document
+STATS_JSON_VERSION = 2
+
+# Format of the content-addressed store index
+STORE_INDEX_VERSION = 1
+
+# Packed bundles: a zip of hooks/<path> members plus a digest manifest
+BUNDLE_VERSION = 1
+BUNDLE_MANIFEST = "MANIFEST.json"
+BUNDLE_PREFIX = "hooks/"
+
+
+def new_stats() -> Dict[str, int]:
+    """Create an empty set of sync counters."""
+    return {name: 0 for name in RESULT_STATS.values()}
+
+
+def new_metrics() -> Dict[str, float]:
+    """Create empty per-phase timings and I/O counters."""
+    metrics = {f"{phase}_seconds": 0.0 for phase in PHASES}
+    # entries_scanned counts the directory listings and entry stats of
+    # scan_hook_tree walks, the per-file I/O that grows with tree size
+    metrics.update({"bytes_hashed": 0, "bytes_copied": 0, "entries_scanned": 0})
+    return metrics
+
+
+def new_layout() -> Dict[str, object]:
+    """Create an empty collector for the non-hook entries of a tree."""
+    return {"dirs": set(), "links": {}, "other": set()}
+
+
+def parent_dirs(rel: str) -> List[str]:
+    """Directories containing a relative path, outermost first ("" is the root)."""
+    parts = rel.split("/")[:-1]
+    return [""] + ["/".join(parts[:depth]) for depth in range(1, len(parts) + 1)]
+
+
+def scan_hook_tree(root: Path, follow_symlinks: bool = True,
+                   metrics: Optional[Dict[str, float]] = None,
+                   layout: Optional[Dict[str, object]] = None) -> Dict[str, os.stat_result]:
+    """
+    Walk a hooks tree once with os.scandir and return the stat of every .py
+    file, keyed by its path relative to root. Symlinked directories are not
+    descended into; a missing root yields an empty result.
+    If a layout from new_layout() is given, it collects the directories
+    walked, other symlinks (with their link text) and other entries.
+    """
+    entries = {}
+    pending = [("", str(root))]
+    scanned = 0
+    while pending:
+        rel_dir, directory = pending.pop()
+        try:
+            scanned += 1
+            with os.scandir(directory) as it:
+                if layout is not None:
+                    layout["dirs"].add(rel_dir)
+                for entry in it:
+                    rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append((rel, entry.path))
+                        elif entry.name.endswith(".py"):
+                            scanned += 1
+                            entries[rel] = entry.stat(follow_symlinks=follow_symlinks)
+                        elif layout is None:
+                            continue
+                        elif entry.is_symlink():
+                            scanned += 1
+                            layout["links"][rel] = os.readlink(entry.path)
+                        else:
+                            layout["other"].add(rel)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    if metrics is not None:
+        metrics["entries_scanned"] += scanned
+    return entries
+
+
+class InotifyWatcher:
+    """Recursive directory watcher built on Linux inotify (via ctypes)."""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+                  IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+    def __init__(self, root: Path):
+        import ctypes
+        import ctypes.util
+        import struct
+        self.root = root
+        self.event = struct.Struct("iIII")
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self.libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # Watch descriptor -> directory relative to root ("" for root itself)
+        self.watches: Dict[int, str] = {}
+        self.add_tree(root)
+
+    def add_tree(self, directory: Path):
+        """Watch a directory and everything below it."""
+        for dirpath, _, _ in os.walk(directory):
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(dirpath), self.WATCH_MASK)
+            if wd >= 0:
+                rel = Path(dirpath).relative_to(self.root).as_posix()
+                self.watches[wd] = "" if rel == "." else rel
+
+    def remove_tree(self, rel_dir: str):
+        """Stop watching a directory that was moved away, and everything below it."""
+        prefix = rel_dir + "/"
+        for wd, rel in list(self.watches.items()):
+            if rel == rel_dir or rel.startswith(prefix):
+                self.libc.inotify_rm_watch(self.fd, wd)
+                del self.watches[wd]
+
+    def wait(self, timeout: Optional[float]) -> Set[str]:
+        """
+        Wait up to timeout seconds (forever if None) for changes.
+        Returns changed paths relative to root; "" means rescan everything.
+        """
+        import select
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self.event.unpack_from(data, offset)
+            offset += self.event.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                changed.add("")
+                continue
+            if mask & self.IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+            rel = f"{directory}/{name}" if directory and name else (name or directory)
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    self.add_tree(self.root / rel)
+                elif mask & self.IN_MOVED_FROM:
+                    self.remove_tree(rel)
+            changed.add(rel)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Fallback watcher that compares stat snapshots of the hook files."""
+
+    def __init__(self, root: Path, interval: float = 1.0):
+        self.root = root
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self) -> Dict[str, tuple]:
+        """Stat every hook file below root."""
+        return {rel: (st.st_size, st.st_mtime_ns, st.st_ino)
+                for rel, st in scan_hook_tree(self.root).items()}
+
+    def wait(self, timeout: Optional[float]) -> Set[str]:
+        """Poll until something changes or timeout seconds pass (forever if None)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+            snapshot = self.scan()
+            changed = {rel for rel in snapshot.keys() | self.snapshot.keys()
+                       if snapshot.get(rel) != self.snapshot.get(rel)}
+            self.snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+def create_watcher(root: Path, poll_interval: float = 1.0, force_poll: bool = False):
+    """Use inotify where available, otherwise fall back to stat polling."""
+    if not force_poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root, poll_interval)
+
+
+def default_store_root() -> Path:
+    """Store location: $CLAUDE_HOOKS_STORE, else claude-hooks in the user cache directory."""
+    if os.environ.get("CLAUDE_HOOKS_STORE"):
+        return Path(os.environ["CLAUDE_HOOKS_STORE"]).expanduser()
+    cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache) / "claude-hooks"
+
+
+class HookStore:
+    """
+    Content-addressed store of hook files shared by every target on a machine.
+    Objects live in objects/<sha256> (<sha256>.x for executable files, since
+    hard links share the mode) and are never modified; index.json maps
+    each version (named by a digest of its file list) to its files, records
+    which version each target uses, and caches source digests by stat.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.objects = root / "objects"
+        self.index_path = root / "index.json"
+        self.index = self.empty_index()
+        self.object_stats: Dict[str, os.stat_result] = {}
+
+    def empty_index(self) -> dict:
+        return {"version": STORE_INDEX_VERSION, "versions": {}, "targets": {}, "sources": {}}
+
+    @contextlib.contextmanager
+    def locked(self):
+        """Hold the store lock (where the platform has flock) with the index loaded."""
+        self.objects.mkdir(parents=True, exist_ok=True)
+        with open(self.root / "index.lock", 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                self.load()
+                yield self
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def load(self):
+        """Read the index, starting a new one if it is missing or unreadable."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get("version") == STORE_INDEX_VERSION:
+                self.index = index
+                return
+        except (OSError, ValueError, AttributeError):
+            pass
+        self.index = self.empty_index()
+
+    def save(self):
+        """Atomically write the index."""
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    @staticmethod
+    def object_name(digest: str, mode: int) -> str:
+        """Name of the object holding content with this digest and file mode."""
+        return digest + ".x" if mode & 0o111 else digest
+
+    @staticmethod
+    def object_digest(name: str) -> str:
+        """Content digest of an object name."""
+        return name.split(".", 1)[0]
+
+    def object_path(self, name: str) -> Path:
+        return self.objects / name
+
+    def object_stat(self, name: str) -> Optional[os.stat_result]:
+        """Stat of a stored object (objects never change, so this is cached)."""
+        st = self.object_stats.get(name)
+        if st is None:
+            try:
+                st = self.object_stats[name] = self.object_path(name).stat()
+            except OSError:
+                return None
+        return st
+
+    def add_object(self, source: Path, digest: str, mode: int, syncer: "HookSyncer") -> str:
+        """
+        Store a read-only copy of source, keeping its execute bits, unless
+        an object with its digest and mode exists. The copy is hashed again
+        before it is named, so a file changing mid-ingest can't end up under
+        the wrong digest.
+        Returns the name the object is stored under.
+        """
+        object_mode = 0o444 | (mode & 0o111)
+        name = self.object_name(digest, mode)
+        st = self.object_stat(name)
+        # Objects from older stores were all made executable: replace those
+        if st is not None and stat.S_IMODE(st.st_mode) == object_mode:
+            return name
+        import shutil
+        tmp_path = self.objects / f".tmp-{os.getpid()}-{threading.get_ident()}"
+        try:
+            if not syncer.reflink_file(source, tmp_path):
+                shutil.copyfile(str(source), str(tmp_path))
+                syncer.metrics["bytes_copied"] += tmp_path.stat().st_size
+            name = self.object_name(syncer.get_file_hash(tmp_path), mode)
+            os.chmod(tmp_path, object_mode)
+            os.replace(tmp_path, self.object_path(name))
+            self.object_stats.pop(name, None)
+        finally:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+        return name
+
+    def add_version(self, files: Dict[str, str], source: Path) -> str:
+        """Record a version (relative path -> object name) and return its name."""
+        import hashlib
+        listing = "".join(f"{rel}\0{name}\n" for rel, name in sorted(files.items()))
+        version = hashlib.sha256(listing.encode("utf-8")).hexdigest()[:16]
+        entry = self.index["versions"].setdefault(version, {
+            "created": time.time(),
+            "source": str(source),
+            "files": files
+        })
+        entry["used"] = time.time()
+        return version
+
+    def resolve_version(self, name: str) -> Optional[str]:
+        """Find a version by its full name or a unique prefix."""
+        versions = self.index["versions"]
+        if name in versions:
+            return name
+        matches = [version for version in versions if version.startswith(name)]
+        return matches[0] if len(matches) == 1 else None
+
+    def gc(self, keep: int = 1) -> Tuple[int, int, int]:
+        """
+        Drop targets that no longer exist, then versions that no target uses
+        (except the keep most recent), then objects no kept version needs.
+        Returns (versions removed, objects removed, bytes freed).
+        """
+        targets = self.index["targets"]
+        for target in [t for t in targets if not Path(t).exists()]:
+            del targets[target]
+
+        versions = self.index["versions"]
+        recent = sorted(versions, key=lambda v: versions[v].get("used", versions[v]["created"]),
+                        reverse=True)[:keep]
+        kept = set(targets.values()) | set(recent)
+        removed_versions = [v for v in versions if v not in kept]
+        for version in removed_versions:
+            del versions[version]
+
+        live = {name for version in versions.values() for name in version["files"].values()}
+        removed_objects = 0
+        freed = 0
+        with os.scandir(self.objects) as entries:
+            for entry in entries:
+                if entry.name in live:
+                    continue
+                try:
+                    size = entry.stat().st_size
+                    os.chmod(entry.path, 0o644)  # Windows won't remove read-only files
+                    os.unlink(entry.path)
+                except OSError:
+                    continue
+                removed_objects += 1
+                freed += size
+        self.save()
+        return len(removed_versions), removed_objects, freed
+
 
 class HookSyncer:
     def __init__(self, source_root: Path, dry_run: bool = False, verbose: bool = False):
@@ -27,14 +492,48 @@ class HookSyncer:
         self.source_hooks = source_root / ".claude" / "hooks"
         self.dry_run = dry_run
         self.verbose = verbose
-        self.is_windows = platform.system() == "Windows"
-        self.stats = {
-            "symlinked": 0,
-            "hard_linked": 0,
-            "copied": 0,
-            "skipped": 0,
-            "errors": 0
-        }
+        self.is_windows = sys.platform == "win32"
+        self.stats = new_stats()
+        self.metrics = new_metrics()
+        # cProfile profiles of worker threads, when profiling is enabled
+        self.profiles: Optional[List[cProfile.Profile]] = None
+        # Per-target stats and syncers when syncing several targets at once
+        self.target_stats: Dict[str, Dict[str, int]] = {}
+        self.workers: Dict[Path, "HookSyncer"] = {}
+        # Manifest loaded from the current target, and the one being rebuilt
+        self.manifest: Dict[str, dict] = {}
+        self.new_manifest: Dict[str, dict] = {}
+        # Target hooks directory the manifests above belong to
+        self.planned_target: Optional[Path] = None
+        # Source scan results, shared by every target synced from this tree
+        self.source_stats: Dict[str, os.stat_result] = {}
+        self.source_digests: Dict[str, Tuple[tuple, str]] = {}
+        self.source_lock = threading.Lock()
+        # Link capabilities per (source device, target device), probed once
+        self.capabilities: Dict[Tuple[int, int], Dict[str, bool]] = {}
+        self.capability_lock = threading.Lock()
+        # Device of each target directory seen, to find its capabilities
+        self.dir_devices: Dict[Path, int] = {}
+
+    def spawn(self) -> "HookSyncer":
+        """Create a syncer for one target that shares this syncer's source scan."""
+        worker = HookSyncer(self.source_root, dry_run=self.dry_run, verbose=self.verbose)
+        worker.source_stats = self.source_stats
+        worker.source_digests = self.source_digests
+        worker.source_lock = self.source_lock
+        worker.profiles = self.profiles
+        worker.capabilities = self.capabilities
+        worker.capability_lock = self.capability_lock
+        return worker
+
+    @contextlib.contextmanager
+    def timed(self, phase: str):
+        """Add the wall time of the block to a phase in metrics."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.metrics[f"{phase}_seconds"] += time.perf_counter() - start
 
     def log(self, message: str, force: bool = False):
         """Log message if verbose or forced."""
@@ -42,29 +541,132 @@ class HookSyncer:
             print(f"[SYNC] {message}")
 
     def get_file_hash(self, file_path: Path) -> str:
-        """Get MD5 hash of file for change detection."""
+        """Get SHA-256 hash of file for change detection."""
+        import hashlib
         try:
+            digest = hashlib.sha256()
             with open(file_path, 'rb') as f:
-                return hashlib.md5(f.read()).hexdigest()
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+                    self.metrics["bytes_hashed"] += len(chunk)
+            return digest.hexdigest()
         except Exception:
             return ""
 
-    def files_are_same(self, source: Path, target: Path) -> bool:
-        """Check if files are identical (same content)."""
-        if not target.exists():
-            return False
-        return self.get_file_hash(source) == self.get_file_hash(target)
+    def load_manifest(self, target_hooks: Path) -> Dict[str, dict]:
+        """Load the sync manifest of a target, or an empty one if missing or invalid."""
+        try:
+            with open(target_hooks / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                return data.get("files", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {}
 
-    def are_hard_linked(self, source: Path, target: Path) -> bool:
-        """Check if two files are hard linked (same inode)."""
+    def save_manifest(self, target_hooks: Path):
+        """Atomically write the rebuilt manifest into the target hooks directory."""
+        # A linked hooks directory is the source tree itself: nothing to track
+        if self.dry_run or os.path.islink(target_hooks):
+            return
+        manifest_path = target_hooks / MANIFEST_NAME
+        tmp_path = manifest_path.with_name(MANIFEST_NAME + ".tmp")
         try:
-            return source.stat().st_ino == target.stat().st_ino
-        except Exception:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": MANIFEST_VERSION, "files": self.new_manifest},
+                          f, indent=1, sort_keys=True)
+            os.replace(tmp_path, manifest_path)
+        except OSError as e:
+            self.log(f"Could not write manifest {manifest_path}: {e}")
+
+    def manifest_key(self, source: Path) -> Optional[str]:
+        """Manifest key for a source file (its path relative to the hooks dir)."""
+        try:
+            return source.relative_to(self.source_hooks).as_posix()
+        except ValueError:
+            return None
+
+    def record_digest(self, key: str, side: str, st: os.stat_result, digest: str):
+        """Remember a file's stat tuple and digest in the manifest being rebuilt."""
+        self.new_manifest.setdefault(key, {})[side] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "ino": st.st_ino,
+            "digest": digest
+        }
+
+    def cached_hash(self, file_path: Path, key: str, side: str,
+                    st: Optional[os.stat_result] = None) -> str:
+        """
+        Get the digest of a file, re-hashing only when its size, mtime_ns or
+        inode differ from what the manifest recorded for it.
+        """
+        try:
+            if st is None:
+                st = file_path.stat()
+        except OSError:
+            return ""
+        stat_key = (st.st_size, st.st_mtime_ns, st.st_ino)
+        if side == "source":
+            # Source digests are shared between targets, so hash each file once
+            with self.source_lock:
+                cached = self.source_digests.get(key)
+                if cached and cached[0] == stat_key:
+                    digest = cached[1]
+                else:
+                    digest = self.lookup_digest(file_path, key, side, stat_key)
+                    self.source_digests[key] = (stat_key, digest)
+        else:
+            digest = self.lookup_digest(file_path, key, side, stat_key)
+        if digest:
+            self.record_digest(key, side, st, digest)
+        return digest
+
+    def lookup_digest(self, file_path: Path, key: str, side: str, stat_key: tuple) -> str:
+        """Take the digest from the manifest if the stat tuple matches, else hash the file."""
+        entry = self.manifest.get(key, {}).get(side)
+        if entry and (entry.get("size"), entry.get("mtime_ns"), entry.get("ino")) == stat_key:
+            return entry.get("digest", "")
+        return self.get_file_hash(file_path)
+
+    def source_stat(self, source: Path) -> os.stat_result:
+        """Stat a source file, reusing the result from the source scan."""
+        key = self.manifest_key(source)
+        st = self.source_stats.get(key) if key is not None else None
+        if st is None:
+            st = source.stat()
+        return st
+
+    def files_are_same(self, source: Path, target: Path,
+                       source_stat: Optional[os.stat_result] = None,
+                       target_stat: Optional[os.stat_result] = None) -> bool:
+        """Check if files are identical (same content), reusing stats when given."""
+        try:
+            source_stat = source_stat or self.source_stat(source)
+            if target_stat is None:
+                target_stat = target.stat()
+        except OSError:
+            return False
+        if source_stat.st_size != target_stat.st_size:
             return False
+        key = self.manifest_key(source)
+        if key is None:
+            return self.get_file_hash(source) == self.get_file_hash(target)
+        source_hash = self.cached_hash(source, key, "source", source_stat)
+        return bool(source_hash) and \
+            source_hash == self.cached_hash(target, key, "target", target_stat)
 
-    def is_symlinked(self, target: Path) -> bool:
-        """Check if target is a symlink."""
-        return target.is_symlink()
+    def record_copy(self, source: Path, target: Path):
+        """Record a freshly copied target in the manifest so it isn't re-hashed next run."""
+        key = self.manifest_key(source)
+        if key is None or self.dry_run:
+            return
+        digest = self.cached_hash(source, key, "source")
+        try:
+            if digest:
+                self.record_digest(key, "target", target.stat(), digest)
+        except OSError:
+            pass
 
     def try_symlink(self, source: Path, target: Path) -> bool:
         """Try to create a symlink. Returns True if successful."""
@@ -77,7 +679,7 @@ class HookSyncer:
             target.parent.mkdir(parents=True, exist_ok=True)
             
             # Remove target if it exists
-            if target.exists() or target.is_symlink():
+            if os.path.lexists(target):
                 target.unlink()
                 
             # Create symlink
@@ -104,29 +706,98 @@ class HookSyncer:
             target.parent.mkdir(parents=True, exist_ok=True)
             
             # Remove target if it exists
-            if target.exists():
+            if os.path.lexists(target):
                 target.unlink()
                 
-            # Create hard link
-            if self.is_windows:
-                # Windows uses different command
-                result = subprocess.run([
-                    "cmd", "/c", "mklink", "/H", str(target), str(source)
-                ], capture_output=True, text=True)
-                success = result.returncode == 0
-            else:
-                os.link(str(source), str(target))
-                success = True
-                
-            if success:
-                self.log(f"Created hard link: {target} -> {source}")
-            return success
-        except (OSError, subprocess.SubprocessError) as e:
+            # Create hard link (os.link uses CreateHardLinkW on Windows)
+            os.link(str(source), str(target))
+            self.log(f"Created hard link: {target} -> {source}")
+            return True
+        except OSError as e:
             self.log(f"Hard link failed for {target}: {e}")
             return False
 
+    def kernel_copy(self, src_fd: int, dst_fd: int, size: int,
+                    try_clone: bool = True) -> Optional[str]:
+        """
+        Copy without moving data through user space: a copy-on-write clone
+        (FICLONE), then os.copy_file_range, then os.sendfile.
+        Returns the path that worked, or None if none is available.
+        """
+        if fcntl is not None and try_clone:
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                return "clone"
+            except OSError:
+                pass
+
+        copiers = []
+        if hasattr(os, "copy_file_range"):
+            copiers.append(("copy_file_range",
+                            lambda count, offset: os.copy_file_range(
+                                src_fd, dst_fd, count, offset, offset)))
+        if sys.platform.startswith("linux") and hasattr(os, "sendfile"):
+            # Only Linux accepts a regular file as sendfile's output
+            copiers.append(("sendfile",
+                            lambda count, offset: os.sendfile(dst_fd, src_fd, offset, count)))
+
+        for name, copy_chunk in copiers:
+            offset = 0
+            try:
+                while offset < size:
+                    copied = copy_chunk(size - offset, offset)
+                    if copied == 0:
+                        break
+                    offset += copied
+                    self.metrics["bytes_copied"] += copied
+                os.ftruncate(dst_fd, offset)
+                return name
+            except OSError:
+                # Discard any partial copy before trying the next path
+                os.ftruncate(dst_fd, 0)
+        return None
+
+    def reflink_file(self, source: Path, target: Path, try_clone: bool = True) -> Optional[str]:
+        """
+        Copy file in the kernel, preferring a copy-on-write clone.
+        Returns the path used ('clone', 'copy_file_range' or 'sendfile'),
+        or None if the file could not be copied this way.
+        """
+        if self.dry_run:
+            self.log(f"Would reflink: {source} -> {target}")
+            return "clone"
+        import shutil
+
+        tmp_target = target.with_name(f".{target.name}.sync-tmp")
+        try:
+            # Create parent directory if needed
+            target.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write beside the target and swap it in, so an existing link to
+            # the source is replaced rather than written through
+            with open(source, 'rb') as src, open(tmp_target, 'wb') as dst:
+                path = self.kernel_copy(src.fileno(), dst.fileno(),
+                                        os.fstat(src.fileno()).st_size, try_clone)
+            if path is None:
+                tmp_target.unlink()
+                self.log(f"Reflink unavailable for {target}")
+                return None
+            shutil.copystat(str(source), str(tmp_target))
+            os.replace(tmp_target, target)
+            self.log(f"Reflinked ({path}): {source} -> {target}")
+            return path
+        except OSError as e:
+            self.log(f"Reflink failed for {target}: {e}")
+            try:
+                tmp_target.unlink()
+            except OSError:
+                pass
+            return None
+
     def copy_file(self, source: Path, target: Path) -> bool:
         """Copy file as fallback method. Returns True if successful."""
+        import shutil
+        tmp_target = target.with_name(f".{target.name}.sync-tmp")
         try:
             if self.dry_run:
                 self.log(f"Would copy: {source} -> {target}")
@@ -135,36 +806,110 @@ class HookSyncer:
             # Create parent directory if needed
             target.parent.mkdir(parents=True, exist_ok=True)
             
-            # Copy file preserving metadata
-            shutil.copy2(str(source), str(target))
+            # Copy file preserving metadata beside the target and swap it in, so
+            # a hard link to a store object or another file is never written through
+            shutil.copy2(str(source), str(tmp_target))
+            os.replace(tmp_target, target)
+            self.metrics["bytes_copied"] += self.source_stat(source).st_size
             self.log(f"Copied: {source} -> {target}")
             return True
         except Exception as e:
             self.log(f"Copy failed for {target}: {e}")
+            with contextlib.suppress(OSError):
+                tmp_target.unlink()
             return False
 
+    def links_to(self, target: Path, source: Path) -> bool:
+        """Check if the symlink target points at source."""
+        try:
+            link = os.readlink(target)
+        except OSError:
+            return False
+        # Links are created with the resolved source path, so this usually matches
+        if link == str(source):
+            return True
+        try:
+            return target.resolve() == source.resolve()
+        except (OSError, RuntimeError):
+            return False
+
+    def plan_file(self, source: Path, target: Path, source_stat: os.stat_result,
+                  target_stat: Optional[os.stat_result]) -> Tuple[str, str]:
+        """
+        Decide what syncing one file needs, from the source stat and the
+        target lstat (None if missing).
+        Returns (action, reason) where action is 'create', 'relink', 'update' or 'skip'.
+        """
+        if target_stat is None:
+            return "create", "missing"
+        if stat.S_ISLNK(target_stat.st_mode):
+            if self.links_to(target, source):
+                return "skip", "already symlinked"
+            return "relink", "symlink points elsewhere"
+        if (target_stat.st_ino, target_stat.st_dev) == (source_stat.st_ino, source_stat.st_dev):
+            return "skip", "already hard linked"
+        if self.files_are_same(source, target, source_stat, target_stat):
+            return "skip", "identical"
+        if target_stat.st_nlink > 1:
+            return "relink", "hard link to other content"
+        return "update", "content differs"
+
     def sync_file(self, source: Path, target: Path, preferred_method: str = "auto") -> str:
         """
         Sync a single file using the best available method.
-        Returns the method used: 'symlink', 'hardlink', 'copy', 'skip', or 'error'
+        Returns the method used: 'symlink', 'hardlink', 'clone', 'copy_file_range',
+        'sendfile', 'copy', 'skip', or 'error'
         """
         # Check if sync is needed
-        if target.exists():
-            if self.is_symlinked(target):
-                # Already symlinked - check if it points to the right place
-                try:
-                    if target.resolve() == source.resolve():
-                        self.log(f"Already symlinked correctly: {target}")
-                        return "skip"
-                except Exception:
-                    pass
-            elif self.are_hard_linked(source, target):
-                self.log(f"Already hard linked: {target}")
-                return "skip"
-            elif self.files_are_same(source, target):
-                self.log(f"Files identical, no sync needed: {target}")
-                return "skip"
+        try:
+            source_stat = self.source_stat(source)
+        except OSError as e:
+            self.log(f"Cannot read source {source}: {e}")
+            return "error"
+        try:
+            target_stat = os.lstat(target)
+        except OSError:
+            target_stat = None
+        with self.timed("compare"):
+            action, reason = self.plan_file(source, target, source_stat, target_stat)
+        if action == "skip":
+            self.log(f"Skipping {target}: {reason}")
+            return "skip"
+        if action == "relink" and not self.unlink_target(target):
+            return "error"
+        return self.link_or_copy(source, target, preferred_method)
+
+    def unlink_target(self, target: Path) -> bool:
+        """
+        Remove a target that is a link to other content, so that it is
+        replaced rather than written through. Returns True if it is gone.
+        """
+        if self.dry_run:
+            self.log(f"Would remove link: {target}")
+            return True
+        try:
+            target.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.log(f"Could not remove link {target}: {e}")
+            return False
+        return True
 
+    def link_or_copy(self, source: Path, target: Path, preferred_method: str = "auto") -> str:
+        """
+        Write target from source with the preferred method, falling back as
+        auto mode allows. Returns the method used, or 'error'.
+        The time taken counts towards the link or copy phase, by result.
+        """
+        start = time.perf_counter()
+        result = self.write_target(source, target, preferred_method)
+        phase = "link" if result in ("symlink", "hardlink") else "copy"
+        self.metrics[f"{phase}_seconds"] += time.perf_counter() - start
+        return result
+
+    def write_target(self, source: Path, target: Path, preferred_method: str) -> str:
+        """Try the sync methods for one file. Returns the method used, or 'error'."""
         # Try sync methods in order based on preference
         if preferred_method == "symlink":
             if self.try_symlink(source, target):
@@ -172,48 +917,379 @@ class HookSyncer:
         elif preferred_method == "hardlink":
             if self.try_hardlink(source, target):
                 return "hardlink"
+        elif preferred_method == "reflink":
+            capabilities = self.capabilities_for(source, target)
+            result = self.reflink_file(source, target, capabilities["clone"]) or \
+                ("copy" if self.copy_file(source, target) else None)
+            if result:
+                self.record_copy(source, target)
+                return result
         elif preferred_method == "copy":
             if self.copy_file(source, target):
+                self.record_copy(source, target)
                 return "copy"
         else:
-            # Auto mode: try symlink -> hardlink -> copy
-            if self.try_symlink(source, target):
+            # Auto mode: try symlink -> hardlink -> reflink -> copy, skipping
+            # methods the filesystem pair is known not to support
+            capabilities = self.capabilities_for(source, target)
+            if capabilities["symlink"] and self.try_symlink(source, target):
                 return "symlink"
-            elif self.try_hardlink(source, target):
+            elif capabilities["hardlink"] and self.try_hardlink(source, target):
                 return "hardlink"
-            elif self.copy_file(source, target):
-                return "copy"
+            result = self.reflink_file(source, target, capabilities["clone"]) or \
+                ("copy" if self.copy_file(source, target) else None)
+            if result:
+                self.record_copy(source, target)
+                return result
         
         return "error"
 
+    def capabilities_for(self, source: Path, target: Path) -> Dict[str, bool]:
+        """
+        Which of symlink, hardlink and clone work from source's filesystem to
+        the target's directory. Probed once per (source device, target device)
+        pair and shared by all workers; a dry run assumes everything works.
+        """
+        if self.dry_run:
+            return {"symlink": True, "hardlink": True, "clone": True}
+        target_dir = target.parent
+        try:
+            source_device = self.source_stat(source).st_dev
+            target_device = self.dir_devices.get(target_dir)
+            if target_device is None:
+                target_dir.mkdir(parents=True, exist_ok=True)
+                target_device = self.dir_devices[target_dir] = target_dir.stat().st_dev
+        except OSError:
+            return {"symlink": True, "hardlink": True, "clone": True}
+
+        key = (source_device, target_device)
+        with self.capability_lock:
+            capabilities = self.capabilities.get(key)
+            if capabilities is None:
+                capabilities = self.capabilities[key] = self.probe_capabilities(source, target_dir)
+                supported = ", ".join(name for name, ok in capabilities.items() if ok) or "none"
+                self.log(f"Link support from device {source_device} to {target_device}: {supported}")
+        return capabilities
+
+    def probe_capabilities(self, source: Path, target_dir: Path) -> Dict[str, bool]:
+        """Try a symlink, a hard link and a FICLONE clone of source into target_dir once."""
+        probe = target_dir / f".sync-probe-{os.getpid()}-{threading.get_ident()}"
+        capabilities = {}
+        for name, create in (("symlink", lambda: os.symlink(str(source.resolve()), str(probe))),
+                             ("hardlink", lambda: os.link(str(source), str(probe)))):
+            try:
+                create()
+                capabilities[name] = True
+            except (OSError, NotImplementedError):
+                capabilities[name] = False
+            finally:
+                with contextlib.suppress(OSError):
+                    probe.unlink()
+
+        capabilities["clone"] = False
+        if fcntl is not None:
+            try:
+                with open(source, 'rb') as src, open(probe, 'wb') as dst:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                capabilities["clone"] = True
+            except OSError:
+                pass
+            finally:
+                with contextlib.suppress(OSError):
+                    probe.unlink()
+        return capabilities
+
     def get_hook_files(self) -> List[Path]:
         """Get list of all hook files to sync."""
         if not self.source_hooks.exists():
             raise FileNotFoundError(f"Source hooks directory not found: {self.source_hooks}")
         
-        hook_files = []
-        
-        # Get all Python files in hooks directory
-        for file_path in self.source_hooks.rglob("*.py"):
-            if file_path.is_file():
-                hook_files.append(file_path)
+        # Get all Python files in hooks directory, keeping their stats for later
+        self.source_stats.clear()
+        with self.timed("discovery"):
+            for key, st in scan_hook_tree(self.source_hooks, metrics=self.metrics).items():
+                if stat.S_ISREG(st.st_mode):
+                    self.source_stats[key] = st
                 
-        return hook_files
+        return [self.source_hooks / key for key in sorted(self.source_stats)]
 
-    def sync_hooks(self, target_project: Path, preferred_method: str = "auto") -> bool:
+    def plan_target(self, target_project: Path, preferred_method: str = "auto",
+                    link_dirs: bool = False) -> dict:
         """
-        Sync all hooks to target project.
-        Returns True if sync was successful.
+        Compare the scanned source tree with one target, walking the target
+        once, and build a serializable plan of create, relink, update, skip
+        and prune actions. Nothing is written to the target.
+        With link_dirs, whole directories without target-local files get a
+        single link_dir action instead of one action per file.
         """
         target_hooks = target_project / ".claude" / "hooks"
         
+        # Load the manifest so unchanged files are not re-hashed
+        self.manifest = self.load_manifest(target_hooks)
+        self.new_manifest = {}
+        self.planned_target = target_hooks
+        
+        layout = new_layout()
+        with self.timed("discovery"):
+            root_link = os.readlink(target_hooks) if os.path.islink(target_hooks) else None
+            if root_link is not None and self.points_into_source(target_hooks, root_link):
+                # The hooks directory itself is linked into the source tree
+                layout["links"][""] = root_link
+                target_stats = {}
+            else:
+                target_stats = scan_hook_tree(target_hooks, follow_symlinks=False,
+                                              metrics=self.metrics, layout=layout)
+        
+        # Only symlink syncs may leave directory links into the source in place;
+        # every other method writes real files, which would land in the source
+        keep_links = preferred_method == "symlink" or (preferred_method == "auto" and link_dirs)
+        actions = []
+        with self.timed("compare"):
+            source_dirs = {rel_dir for key in self.source_stats for rel_dir in parent_dirs(key)}
+            local = self.local_dirs(target_hooks, target_stats, layout) if link_dirs else set()
+            
+            # Directories handled as a whole, outermost first
+            covered = set()
+            for rel_dir in sorted(source_dirs, key=lambda d: (d.count("/") + bool(d), d)):
+                if covered.intersection(parent_dirs(rel_dir + "/")):
+                    continue
+                action = self.plan_directory(target_hooks, rel_dir, layout, local, link_dirs, keep_links)
+                if action:
+                    actions.append(action)
+                    if action["action"] != "unlink_dir":
+                        covered.add(rel_dir)
+            
+            for key in sorted(self.source_stats):
+                if covered.intersection(parent_dirs(key)):
+                    continue
+                action, reason = self.plan_file(self.source_hooks / key, target_hooks / key,
+                                                self.source_stats[key], target_stats.get(key))
+                actions.append({"action": action, "path": key, "reason": reason})
+                
+            # Files we synced earlier whose source has since been deleted
+            for key in sorted(target_stats.keys() - self.source_stats.keys()):
+                if covered.intersection(parent_dirs(key)):
+                    continue
+                if self.is_synced_by_us(target_hooks, key, target_stats[key]):
+                    actions.append({"action": "prune", "path": key, "reason": "deleted upstream"})
+            
+            # Directory links whose source directory is gone
+            for rel, link in sorted(layout["links"].items()):
+                if rel and rel not in source_dirs and not covered.intersection(parent_dirs(rel)) \
+                        and self.points_into_source(target_hooks / rel, link):
+                    actions.append({"action": "prune", "path": rel, "dir": True,
+                                    "reason": "deleted upstream"})
+                
+        return {
+            "version": PLAN_VERSION,
+            "source": str(self.source_hooks),
+            "target": str(target_hooks),
+            "method": preferred_method,
+            "actions": actions
+        }
+
+    def plan_directory(self, target_hooks: Path, rel_dir: str, layout: Dict[str, object],
+                       local: Set[str], link_dirs: bool, keep_links: bool = True) -> Optional[dict]:
+        """
+        Decide if a source directory can be handled by one action on the target.
+        Existing links to the right directory are skipped when keep_links
+        (per-file syncing through them would write into the source tree);
+        otherwise links into the source get an unlink_dir action that turns
+        them into real directories before their files are written.
+        Returns the action, or None if its files must be planned one by one.
+        """
+        path = rel_dir or "."
+        link = layout["links"].get(rel_dir)
+        if link is not None:
+            link_path = target_hooks / rel_dir
+            if not keep_links:
+                if self.points_into_source(link_path, link):
+                    return {"action": "unlink_dir", "path": path, "dir": True,
+                            "reason": "directory link into the source"}
+                return None
+            if self.link_target(link_path, link) == self.source_hooks / rel_dir:
+                return {"action": "skip", "path": path, "dir": True, "reason": "directory symlinked"}
+            if self.points_into_source(link_path, link):
+                return {"action": "link_dir", "path": path, "dir": True,
+                        "reason": "stale directory link"}
+            return None
+        if not link_dirs or rel_dir in layout["other"]:
+            return None
+        if rel_dir not in layout["dirs"]:
+            return {"action": "link_dir", "path": path, "dir": True, "reason": "missing"}
+        if rel_dir not in local:
+            return {"action": "link_dir", "path": path, "dir": True, "reason": "no local overrides"}
+        return None
+
+    def local_dirs(self, target_hooks: Path, target_stats: Dict[str, os.stat_result],
+                   layout: Dict[str, object], prefix: str = "") -> Set[str]:
+        """
+        Directories (relative to target_hooks, "" for the root) that contain
+        target-local files, i.e. anything this script did not put there.
+        Bytecode caches and the sync manifest don't count. Paths in the scan
+        are relative to target_hooks / prefix.
+        """
+        local = set()
+        for rel, st in target_stats.items():
+            key = prefix + rel
+            if not self.is_synced_by_us(target_hooks, key, st):
+                local.update(parent_dirs(key))
+        for rel in layout["other"]:
+            key = prefix + rel
+            if key in SYNC_BOOKKEEPING or "__pycache__" in key.split("/"):
+                continue
+            local.update(parent_dirs(key))
+        for rel, link in layout["links"].items():
+            key = prefix + rel
+            if not self.points_into_source(target_hooks / key, link):
+                local.update(parent_dirs(key))
+        return local
+
+    def apply_plan(self, plan: dict) -> bool:
+        """
+        Execute a plan from plan_target, possibly one loaded from JSON.
+        Returns True if every action succeeded.
+        """
+        target_hooks = Path(plan["target"])
+        preferred_method = plan.get("method", "auto")
+        
         self.log(f"Syncing hooks from {self.source_hooks} to {target_hooks}", force=True)
         
+        if Path(plan["source"]) != self.source_hooks:
+            print(f"Error: Plan was made for source {plan['source']}, not {self.source_hooks}")
+            self.stats["errors"] += 1
+            return False
+        
+        # A plan made by another process starts from the manifest on disk
+        if self.planned_target != target_hooks:
+            self.manifest = self.load_manifest(target_hooks)
+            self.new_manifest = {}
+        
         # Create target hooks directory
         if not self.dry_run:
             target_hooks.mkdir(parents=True, exist_ok=True)
         
-        # Get all hook files
+        success = True
+        # Directory links into the source that could not be replaced: nothing
+        # may be written below them
+        unlinked_failed = set()
+        for entry in plan["actions"]:
+            action, key = entry["action"], entry["path"]
+            target_file = target_hooks / key
+            if unlinked_failed.intersection(parent_dirs(key)):
+                continue
+            
+            if action == "skip":
+                result = "skip"
+                if not entry.get("dir"):
+                    self.new_manifest.setdefault(key, self.manifest.get(key, {}))
+            elif action == "link_dir":
+                with self.timed("link"):
+                    result = self.link_directory(target_hooks, "" if key == "." else key)
+                if result is None:
+                    # Could not link the directory: sync its files one by one
+                    success = self.sync_directory_files(
+                        target_hooks, "" if key == "." else key, preferred_method) and success
+                    continue
+            elif action == "unlink_dir":
+                with self.timed("link"):
+                    replaced = self.unlink_directory(target_file)
+                if replaced:
+                    continue
+                unlinked_failed.add("" if key == "." else key)
+                result = "error"
+            elif action == "prune":
+                with self.timed("prune"):
+                    removed = self.remove_synced_file(target_hooks, key)
+                if not removed:
+                    continue
+                result = "remove"
+            elif action in ("create", "relink", "update"):
+                if action == "relink" and not self.unlink_target(target_file):
+                    result = "error"
+                else:
+                    result = self.link_or_copy(self.source_hooks / key, target_file, preferred_method)
+                if result != "error":
+                    # Track every synced file so later deletions can be propagated
+                    entry_manifest = self.new_manifest.setdefault(key, {})
+                    if result in ("symlink", "hardlink"):
+                        entry_manifest.pop("target", None)
+            else:
+                print(f"Unknown plan action '{action}' for {key}")
+                result = "error"
+            self.stats[RESULT_STATS[result]] += 1
+            
+            if result == "error":
+                success = False
+                print(f"Failed to sync: {target_file}")
+            elif self.verbose:
+                self.log(f"{result.capitalize()}: {key}")
+        
+        # The manifest would land in the source through a hooks root link
+        if "" not in unlinked_failed:
+            self.save_manifest(target_hooks)
+        return success
+
+    def link_directory(self, target_hooks: Path, rel_dir: str) -> Optional[str]:
+        """
+        Replace a target directory holding only synced files (or nothing) with
+        a single symlink to the source directory.
+        Returns 'link_dir', or None if the directory has to be synced per file.
+        """
+        import shutil
+        source_dir = self.source_hooks / rel_dir
+        target_dir = target_hooks / rel_dir
+        if self.dry_run:
+            self.log(f"Would symlink directory: {target_dir} -> {source_dir}")
+            return "link_dir"
+        try:
+            # One lstat tells a link to replace from a directory to clear
+            try:
+                target_mode = os.lstat(target_dir).st_mode
+            except FileNotFoundError:
+                target_mode = 0
+            if stat.S_ISLNK(target_mode):
+                target_dir.unlink()
+            elif stat.S_ISDIR(target_mode):
+                # Check again for local files right before deleting anything
+                prefix = rel_dir + "/" if rel_dir else ""
+                layout = new_layout()
+                target_stats = scan_hook_tree(target_dir, follow_symlinks=False,
+                                              metrics=self.metrics, layout=layout)
+                if self.local_dirs(target_hooks, target_stats, layout, prefix):
+                    self.log(f"Local files in {target_dir}, syncing it per file")
+                    return None
+                shutil.rmtree(target_dir)
+            target_dir.parent.mkdir(parents=True, exist_ok=True)
+            os.symlink(str(source_dir), str(target_dir), target_is_directory=True)
+        except OSError as e:
+            self.log(f"Directory symlink failed for {target_dir}: {e}")
+            return None
+        self.log(f"Created directory symlink: {target_dir} -> {source_dir}")
+        return "link_dir"
+
+    def sync_directory_files(self, target_hooks: Path, rel_dir: str,
+                             preferred_method: str) -> bool:
+        """Sync every hook file below a source directory one by one. Returns True on success."""
+        prefix = rel_dir + "/" if rel_dir else ""
+        success = True
+        for rel in sorted(scan_hook_tree(self.source_hooks / rel_dir, metrics=self.metrics)):
+            key = prefix + rel
+            result = self.sync_file(self.source_hooks / key, target_hooks / key, preferred_method)
+            self.stats[RESULT_STATS[result]] += 1
+            if result == "error":
+                success = False
+                print(f"Failed to sync: {target_hooks / key}")
+            else:
+                self.new_manifest.setdefault(key, {})
+        return success
+
+    def sync_hooks(self, target_project: Path, preferred_method: str = "auto",
+                   link_dirs: bool = False) -> bool:
+        """
+        Sync all hooks to target project by planning and applying in one go.
+        Returns True if sync was successful.
+        """
         try:
             hook_files = self.get_hook_files()
         except FileNotFoundError as e:
@@ -225,36 +1301,780 @@ class HookSyncer:
             return False
             
         self.log(f"Found {len(hook_files)} hook files to sync")
-        
-        # Sync each file
+        return self.apply_plan(self.plan_target(target_project, preferred_method, link_dirs))
+
+    def is_synced_by_us(self, target_hooks: Path, key: str,
+                        target_stat: Optional[os.stat_result] = None) -> bool:
+        """
+        Check if a target file was put there by this script: tracked in the
+        manifest, or a symlink into the source tree.
+        """
+        if key in self.manifest:
+            return True
+        try:
+            if target_stat is None:
+                target_stat = os.lstat(target_hooks / key)
+            if not stat.S_ISLNK(target_stat.st_mode):
+                return False
+            return self.points_into_source(target_hooks / key, os.readlink(target_hooks / key))
+        except OSError:
+            return False
+
+    def link_target(self, link_path: Path, link: str) -> Path:
+        """Absolute, normalized path a symlink's text refers to."""
+        if not os.path.isabs(link):
+            link = os.path.join(os.path.dirname(link_path), link)
+        return Path(os.path.normpath(link))
+
+    def points_into_source(self, link_path: Path, link: str) -> bool:
+        """Check if a symlink's text refers to the source hooks tree."""
+        resolved = self.link_target(link_path, link)
+        return resolved == self.source_hooks or self.source_hooks in resolved.parents
+
+    def remove_synced_file(self, target_hooks: Path, key: str) -> bool:
+        """
+        Remove a target file whose source was deleted, but only if this script
+        put it there. Returns True if the file was removed.
+        """
+        target = target_hooks / key
+        if not os.path.lexists(target):
+            return False
+        if not self.is_synced_by_us(target_hooks, key):
+            self.log(f"Keeping target-local file: {target}")
+            return False
+        if self.dry_run:
+            self.log(f"Would remove: {target}")
+            return True
+        try:
+            target.unlink()
+        except OSError as e:
+            self.log(f"Remove failed for {target}: {e}")
+            return False
+        self.log(f"Removed: {target}")
+        # Clean up directories left empty by the removal
+        parent = target.parent
+        while parent != target_hooks and parent.is_dir():
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+            parent = parent.parent
+        return True
+
+    def sync_paths(self, target_project: Path, keys: Set[str],
+                   preferred_method: str = "auto") -> bool:
+        """
+        Incrementally sync only the given hook files (relative paths) to a
+        target that was synced before. Files missing from the source are removed.
+        Returns True if every file synced successfully.
+        """
+        target_hooks = target_project / ".claude" / "hooks"
+        # The last written manifest is the base for this update
+        self.manifest = self.new_manifest or self.load_manifest(target_hooks)
+        self.new_manifest = dict(self.manifest)
+
         success = True
-        for source_file in hook_files:
-            # Calculate relative path from hooks directory
-            rel_path = source_file.relative_to(self.source_hooks)
-            target_file = target_hooks / rel_path
-            
-            # Sync the file
-            result = self.sync_file(source_file, target_file, preferred_method)
-            self.stats[result.replace("link", "linked")] += 1
-            
+        for key in sorted(keys):
+            source_file = self.source_hooks / key
+            target_file = target_hooks / key
+            self.new_manifest.pop(key, None)
+            if key in self.source_stats:
+                result = self.sync_file(source_file, target_file, preferred_method)
+                if result != "error":
+                    self.new_manifest.setdefault(key, {})
+            else:
+                with self.timed("prune"):
+                    removed = self.remove_synced_file(target_hooks, key)
+                if not removed:
+                    continue
+                result = "remove"
+            self.stats[RESULT_STATS[result]] += 1
             if result == "error":
                 success = False
-                print(f"Failed to sync: {rel_path}")
-            elif self.verbose:
-                self.log(f"{result.capitalize()}: {rel_path}")
+                print(f"Failed to sync: {target_file}")
+            elif result != "skip":
+                self.log(f"{result.capitalize()}: {target_file}")
+
+        self.save_manifest(target_hooks)
+        return success
+
+    def run_workers(self, items: list, task, jobs: int = DEFAULT_JOBS) -> List[tuple]:
+        """
+        Run task(worker, item) for each item on a bounded thread pool, each
+        with its own worker syncer sharing this syncer's source scan.
+        Returns (item, worker, result) tuples in input order; result is None
+        if the task raised.
+        """
+        import cProfile
+        from concurrent.futures import ThreadPoolExecutor
+
+        def run(item) -> tuple:
+            worker = self.spawn()
+            # cProfile only sees the thread it is enabled in
+            profiler = cProfile.Profile() if self.profiles is not None else None
+            if profiler:
+                profiler.enable()
+            try:
+                result = task(worker, item)
+            except Exception as e:
+                print(f"Error syncing {item}: {e}")
+                worker.stats["errors"] += 1
+                result = None
+            finally:
+                if profiler:
+                    profiler.disable()
+                    self.profiles.append(profiler)
+            return item, worker, result
+
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            return list(pool.map(run, items))
+
+    def collect_stats(self, target: Path, worker: "HookSyncer"):
+        """Keep a worker's per-target stats and add them to the totals."""
+        self.workers[target] = worker
+        self.target_stats[str(target)] = worker.stats
+        for name, count in worker.stats.items():
+            self.stats[name] += count
+
+    def scan_source(self) -> bool:
+        """Scan the source tree once for all targets. Returns False if there is nothing to sync."""
+        try:
+            hook_files = self.get_hook_files()
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            return False
+            
+        if not hook_files:
+            print("No hook files found to sync")
+            return False
         
+        self.log(f"Found {len(hook_files)} hook files to sync")
+        return True
+
+    def sync_many(self, targets: List[Path], preferred_method: str = "auto",
+                  jobs: int = DEFAULT_JOBS, link_dirs: bool = False) -> bool:
+        """
+        Sync hooks to several target projects concurrently.
+        The source tree is scanned once and each source file is hashed at most
+        once; per-target stats are kept in target_stats and summed into stats.
+        Returns True if every target synced successfully.
+        """
+        if not self.scan_source():
+            return False
+
+        def sync_target(worker: "HookSyncer", target: Path) -> bool:
+            return worker.apply_plan(worker.plan_target(target, preferred_method, link_dirs))
+
+        success = True
+        for target, worker, ok in self.run_workers(targets, sync_target, jobs):
+            self.collect_stats(target, worker)
+            success = success and bool(ok)
+        return success
+
+    def plan_many(self, targets: List[Path], preferred_method: str = "auto",
+                  jobs: int = DEFAULT_JOBS, link_dirs: bool = False) -> Optional[List[dict]]:
+        """
+        Build sync plans for several targets without changing anything.
+        Returns None if the source tree has nothing to sync.
+        """
+        if not self.scan_source():
+            return None
+        results = self.run_workers(
+            targets, lambda worker, target: worker.plan_target(target, preferred_method, link_dirs),
+            jobs)
+        for target, worker, _ in results:
+            self.workers[target] = worker
+        return [plan for _, _, plan in results if plan is not None]
+
+    def apply_plans(self, plans: List[dict], jobs: int = DEFAULT_JOBS) -> bool:
+        """
+        Apply saved plans (as written by --dry-run) concurrently.
+        Returns True if every plan applied cleanly.
+        """
+        for plan in plans:
+            if plan.get("version") != PLAN_VERSION:
+                print(f"Error: Unsupported plan version: {plan.get('version')}")
+                return False
+
+        success = True
+        for plan, worker, ok in self.run_workers(plans, lambda worker, plan: worker.apply_plan(plan), jobs):
+            self.collect_stats(Path(plan["target"]).parent.parent, worker)
+            success = success and bool(ok)
+        return success
+
+    def scan_real_target(self, target_hooks: Path) -> Tuple[Optional[Dict[str, os.stat_result]], Set[str]]:
+        """
+        Scan a target that is about to get real files rather than links to
+        the source (store and bundle syncs). Directory links into the source
+        tree, including a linked hooks directory, are first replaced with
+        empty directories, so nothing is written through them into the source.
+        Returns the target stats (None if a link could not be replaced) and
+        the other directory links, which files must not be written through.
+        """
+        layout = new_layout()
+        with self.timed("discovery"):
+            if os.path.islink(target_hooks):
+                layout["links"][""] = os.readlink(target_hooks)
+                target_stats = {}
+            else:
+                target_stats = scan_hook_tree(target_hooks, follow_symlinks=False,
+                                              metrics=self.metrics, layout=layout)
+
+        foreign = set()
+        for rel, link in sorted(layout["links"].items()):
+            link_path = target_hooks / rel if rel else target_hooks
+            if not os.path.isdir(link_path):
+                continue
+            if not self.points_into_source(link_path, link):
+                foreign.add(rel)
+            elif not self.unlink_directory(link_path):
+                return None, foreign
+        return target_stats, foreign
+
+    def unlink_directory(self, link_path: Path) -> bool:
+        """
+        Replace a directory link into the source with an empty directory, so
+        real files can be written without going through it into the source.
+        Returns True on success.
+        """
+        if self.dry_run:
+            self.log(f"Would replace directory link with a directory: {link_path}")
+            return True
+        try:
+            link_path.unlink()
+            link_path.mkdir(parents=True)
+        except OSError as e:
+            print(f"Error: Could not replace directory link {link_path}: {e}")
+            return False
+        self.log(f"Replaced link into the source with a directory: {link_path}")
+        return True
+
+    def ingest_source(self, store: HookStore) -> Optional[str]:
+        """
+        Add the scanned source files to the store and record them as a version.
+        Source digests are cached in the store index, so unchanged files are
+        not re-hashed. Returns the version name, or None on error.
+        """
+        source_key = str(self.source_hooks)
+        cache = store.index["sources"].get(source_key, {})
+        self.manifest = {key: {"source": entry} for key, entry in cache.items()}
+        self.new_manifest = {}
+
+        files = {}
+        with self.timed("copy"):
+            for key, st in sorted(self.source_stats.items()):
+                source_file = self.source_hooks / key
+                digest = self.cached_hash(source_file, key, "source", st)
+                if not digest:
+                    print(f"Error: Could not read {source_file}")
+                    return None
+                try:
+                    files[key] = store.add_object(source_file, digest, st.st_mode, self)
+                except OSError as e:
+                    print(f"Error: Could not store {source_file}: {e}")
+                    return None
+
+        store.index["sources"][source_key] = {
+            key: entry["source"] for key, entry in self.new_manifest.items() if "source" in entry
+        }
+        return store.add_version(files, self.source_hooks)
+
+    def store_link(self, obj: Path, target: Path) -> str:
+        """
+        Point target at a store object: a hard link swapped in atomically,
+        else a reflink or a copy. Returns the method used, or 'error'.
+        """
+        capabilities = self.capabilities_for(obj, target)
+        tmp_target = target.with_name(f".{target.name}.sync-tmp")
+        if capabilities["hardlink"]:
+            try:
+                os.link(str(obj), str(tmp_target))
+                os.replace(tmp_target, target)
+                return "hardlink"
+            except OSError as e:
+                self.log(f"Hard link failed for {target}: {e}")
+                with contextlib.suppress(OSError):
+                    tmp_target.unlink()
+        result = self.reflink_file(obj, target, capabilities["clone"])
+        if result:
+            return result
+        import shutil
+        try:
+            # Copy beside the target: an earlier copy of a read-only object
+            # can't be opened for writing
+            shutil.copy2(str(obj), str(tmp_target))
+            os.replace(tmp_target, target)
+            self.metrics["bytes_copied"] += obj.stat().st_size
+            return "copy"
+        except OSError as e:
+            self.log(f"Copy failed for {target}: {e}")
+            with contextlib.suppress(OSError):
+                tmp_target.unlink()
+            return "error"
+
+    def sync_from_store(self, target_project: Path, store: HookStore, version: str) -> bool:
+        """
+        Make a target match a stored version: each file becomes a link to
+        (or copy of) its immutable object, and files we synced that are not
+        in the version are removed. Returns True on success.
+        """
+        target_hooks = target_project / ".claude" / "hooks"
+        files = store.index["versions"][version]["files"]
+        self.log(f"Syncing store version {version} to {target_hooks}", force=True)
+
+        target_stats, foreign = self.scan_real_target(target_hooks)
+        if target_stats is None:
+            self.stats["errors"] += 1
+            return False
+        self.manifest = self.load_manifest(target_hooks)
+        self.new_manifest = {}
+        self.planned_target = target_hooks
+
+        success = True
+        for key, name in sorted(files.items()):
+            target_file = target_hooks / key
+            digest = store.object_digest(name)
+            if foreign.intersection(parent_dirs(key)):
+                print(f"Error: Not writing {target_file} through a directory link")
+                self.stats["errors"] += 1
+                success = False
+                continue
+            target_stat = target_stats.get(key)
+            obj_stat = store.object_stat(name)
+            with self.timed("compare"):
+                up_to_date = target_stat is not None and obj_stat is not None and (
+                    (target_stat.st_ino, target_stat.st_dev) == (obj_stat.st_ino, obj_stat.st_dev)
+                    or (stat.S_ISREG(target_stat.st_mode)
+                        and target_stat.st_size == obj_stat.st_size
+                        and target_stat.st_mode & 0o111 == obj_stat.st_mode & 0o111
+                        and self.cached_hash(target_file, key, "target", target_stat) == digest))
+            if up_to_date:
+                result = "skip"
+            elif obj_stat is None:
+                print(f"Error: Store object missing for {key}: {name}")
+                result = "error"
+            else:
+                start = time.perf_counter()
+                target_file.parent.mkdir(parents=True, exist_ok=True)
+                result = self.store_link(store.object_path(name), target_file)
+                phase = "link" if result == "hardlink" else "copy"
+                self.metrics[f"{phase}_seconds"] += time.perf_counter() - start
+            self.stats[RESULT_STATS[result]] += 1
+
+            if result == "error":
+                success = False
+                print(f"Failed to sync: {target_file}")
+                continue
+            if "target" not in self.new_manifest.get(key, {}):
+                with contextlib.suppress(OSError):
+                    self.record_digest(key, "target", target_file.stat(), digest)
+            # Record the source too when this version is the current source,
+            # so --check can vouch for objects whose mtime isn't the source's
+            source_st = self.source_stats.get(key)
+            if source_st is not None and self.source_digests.get(key, ((), ""))[1] == digest:
+                self.record_digest(key, "source", source_st, digest)
+            self.new_manifest.setdefault(key, {})
+
+        for key in sorted(target_stats.keys() - files.keys()):
+            with self.timed("prune"):
+                removed = self.remove_synced_file(target_hooks, key)
+            if removed:
+                self.stats["removed"] += 1
+
+        self.save_manifest(target_hooks)
+        return success
+
+    def sync_store(self, targets: List[Path], store: HookStore, version_name: Optional[str] = None,
+                   jobs: int = DEFAULT_JOBS) -> bool:
+        """
+        Sync targets through the content-addressed store: ingest the source
+        as a new version (or use version_name to pin or roll back), link
+        every target to it and record which version each target now uses.
+        Returns True if every target synced successfully.
+        """
+        with store.locked():
+            if version_name:
+                version = store.resolve_version(version_name)
+                if version is None:
+                    print(f"Error: No single stored version matches '{version_name}'")
+                    return False
+            else:
+                if not self.scan_source():
+                    return False
+                version = self.ingest_source(store)
+                if version is None:
+                    return False
+                store.save()
+
+            files = store.index["versions"][version]["files"]
+            self.log(f"Store version {version}: {len(files)} files in {store.root}", force=True)
+
+            success = True
+            for target, worker, ok in self.run_workers(
+                    targets, lambda worker, target: worker.sync_from_store(target, store, version), jobs):
+                self.collect_stats(target, worker)
+                if ok:
+                    store.index["targets"][str(target / ".claude" / "hooks")] = version
+                success = success and bool(ok)
+            store.save()
         return success
 
+    def export_bundle(self, bundle_path: Path) -> bool:
+        """
+        Pack the source hooks into one compressed bundle. Each file is hashed
+        as it is compressed and the digests, sizes and modes are stored in an
+        embedded manifest. Returns True on success.
+        """
+        import hashlib
+        import zipfile
+        if not self.scan_source():
+            return False
+        files = {}
+        tmp_path = bundle_path.with_name(f".{bundle_path.name}.tmp")
+        try:
+            with self.timed("copy"), zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as bundle:
+                for key, st in sorted(self.source_stats.items()):
+                    info = zipfile.ZipInfo.from_file(str(self.source_hooks / key), BUNDLE_PREFIX + key)
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    digest = hashlib.sha256()
+                    size = 0
+                    with open(self.source_hooks / key, 'rb') as src, bundle.open(info, 'w') as dst:
+                        for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                            digest.update(chunk)
+                            dst.write(chunk)
+                            size += len(chunk)
+                    self.metrics["bytes_hashed"] += size
+                    self.metrics["bytes_copied"] += size
+                    files[key] = {"size": size, "mode": stat.S_IMODE(st.st_mode),
+                                  "mtime_ns": st.st_mtime_ns, "digest": digest.hexdigest()}
+                    self.stats["copied"] += 1
+                bundle.writestr(BUNDLE_MANIFEST, json.dumps({
+                    "version": BUNDLE_VERSION,
+                    "created": time.time(),
+                    "files": files
+                }, indent=1, sort_keys=True))
+            os.replace(tmp_path, bundle_path)
+        except OSError as e:
+            print(f"Error: Could not write bundle {bundle_path}: {e}")
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            return False
+        self.log(f"Exported {len(files)} hook files to {bundle_path}", force=True)
+        return True
+
+    def extract_member(self, bundle: zipfile.ZipFile, key: str, entry: dict, target: Path) -> str:
+        """
+        Decompress one bundle file beside the target, check its digest and
+        swap it in. Returns 'copy', or 'error' if it could not be extracted.
+        """
+        import hashlib
+        import zipfile
+        tmp_target = target.with_name(f".{target.name}.sync-tmp")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            digest = hashlib.sha256()
+            with bundle.open(BUNDLE_PREFIX + key) as src, open(tmp_target, 'wb') as dst:
+                for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                    digest.update(chunk)
+                    dst.write(chunk)
+                    self.metrics["bytes_hashed"] += len(chunk)
+                    self.metrics["bytes_copied"] += len(chunk)
+            if digest.hexdigest() != entry["digest"]:
+                raise OSError(f"digest mismatch in bundle for {key}")
+            os.chmod(tmp_target, entry.get("mode", 0o644) & 0o777)
+            if isinstance(entry.get("mtime_ns"), int):
+                # Keep the source mtime, as copies do, so --check can compare stats
+                os.utime(tmp_target, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+            os.replace(tmp_target, target)
+            self.log(f"Extracted: {key} -> {target}")
+            return "copy"
+        except (OSError, KeyError, zipfile.BadZipFile) as e:
+            print(f"Error: Could not extract {key}: {e}")
+            with contextlib.suppress(OSError):
+                tmp_target.unlink()
+            return "error"
+
+    def sync_from_bundle(self, target_project: Path, bundle_path: Path, files: Dict[str, dict]) -> bool:
+        """
+        Make a target match a bundle. Files whose size and digest already
+        match the bundle manifest are skipped without being decompressed;
+        files we synced that the bundle no longer has are removed.
+        Returns True on success.
+        """
+        import zipfile
+        target_hooks = target_project / ".claude" / "hooks"
+        self.log(f"Syncing bundle {bundle_path} to {target_hooks}", force=True)
+
+        target_stats, foreign = self.scan_real_target(target_hooks)
+        if target_stats is None:
+            self.stats["errors"] += 1
+            return False
+        self.manifest = self.load_manifest(target_hooks)
+        self.new_manifest = {}
+        self.planned_target = target_hooks
+
+        success = True
+        # Each worker opens the bundle itself: a ZipFile handle isn't shared across threads
+        with zipfile.ZipFile(bundle_path) as bundle:
+            for key, entry in sorted(files.items()):
+                target_file = target_hooks / key
+                if foreign.intersection(parent_dirs(key)):
+                    print(f"Error: Not writing {target_file} through a directory link")
+                    self.stats["errors"] += 1
+                    success = False
+                    continue
+                target_stat = target_stats.get(key)
+                with self.timed("compare"):
+                    up_to_date = (target_stat is not None and stat.S_ISREG(target_stat.st_mode)
+                                  and target_stat.st_size == entry["size"]
+                                  and self.cached_hash(target_file, key, "target", target_stat) == entry["digest"])
+                if up_to_date:
+                    result = "skip"
+                else:
+                    with self.timed("copy"):
+                        result = self.extract_member(bundle, key, entry, target_file)
+                self.stats[RESULT_STATS[result]] += 1
+
+                if result == "error":
+                    success = False
+                    print(f"Failed to sync: {target_file}")
+                    continue
+                if result != "skip":
+                    with contextlib.suppress(OSError):
+                        self.record_digest(key, "target", target_file.stat(), entry["digest"])
+                self.new_manifest.setdefault(key, {})
+
+        for key in sorted(target_stats.keys() - files.keys()):
+            with self.timed("prune"):
+                removed = self.remove_synced_file(target_hooks, key)
+            if removed:
+                self.stats["removed"] += 1
+
+        self.save_manifest(target_hooks)
+        return success
+
+    def sync_bundle(self, targets: List[Path], bundle_path: Path, jobs: int = DEFAULT_JOBS) -> bool:
+        """Sync targets from a bundle written by export_bundle. Returns True if all succeeded."""
+        import zipfile
+        try:
+            files = read_bundle_manifest(bundle_path)
+        except (OSError, ValueError, KeyError, TypeError, zipfile.BadZipFile) as e:
+            print(f"Error: Could not read bundle {bundle_path}: {e}")
+            return False
+        self.log(f"Bundle {bundle_path}: {len(files)} files", force=True)
+
+        success = True
+        for target, worker, ok in self.run_workers(
+                targets, lambda worker, target: worker.sync_from_bundle(target, bundle_path, files), jobs):
+            self.collect_stats(target, worker)
+            success = success and bool(ok)
+        return success
+
+    def check_target(self, target_project: Path, first_only: bool = True) -> List[Tuple[Path, str]]:
+        """
+        Check a target against the scanned source by stat alone, without
+        hashing. A file is up to date if it is the source file (a symlink or
+        hard link), has the source's size and mtime_ns (a copy), or the
+        manifest vouches for the current stats of both files.
+        Returns (target file, reason) pairs for out-of-date files, stopping
+        at the first one if first_only.
+        """
+        target_hooks = target_project / ".claude" / "hooks"
+        manifest = self.load_manifest(target_hooks)
+        stale = []
+        for key, source_st in sorted(self.source_stats.items()):
+            target_file = target_hooks / key
+            try:
+                target_st = os.stat(target_file)
+            except OSError:
+                reason = "missing"
+            else:
+                if (target_st.st_dev, target_st.st_ino) == (source_st.st_dev, source_st.st_ino):
+                    continue
+                if target_st.st_size != source_st.st_size:
+                    reason = "size differs"
+                elif target_st.st_mtime_ns == source_st.st_mtime_ns:
+                    continue
+                else:
+                    entry = manifest.get(key, {})
+                    source_entry = entry.get("source") or {}
+                    target_entry = entry.get("target") or {}
+                    if (source_entry.get("digest") and source_entry.get("digest") == target_entry.get("digest")
+                            and all(source_entry.get(name) == getattr(source_st, f"st_{name}")
+                                    and target_entry.get(name) == getattr(target_st, f"st_{name}")
+                                    for name in ("size", "mtime_ns", "ino"))):
+                        continue
+                    reason = "mtime differs"
+            stale.append((target_file, reason))
+            if first_only:
+                return stale
+
+        # Files synced earlier whose source has since been removed
+        for key in sorted(manifest.keys() - self.source_stats.keys()):
+            target_file = target_hooks / key
+            if os.path.lexists(target_file):
+                stale.append((target_file, "removed from source"))
+                if first_only:
+                    return stale
+        return stale
+
+    def expand_changes(self, changed: Set[str]) -> Set[str]:
+        """
+        Turn changed paths reported by a watcher (files or directories) into
+        the set of affected hook files, refreshing the shared source stats.
+        """
+        known = set(self.source_stats)
+        if "" in changed:
+            # Watcher lost track of events: rescan the whole tree
+            try:
+                self.get_hook_files()
+            except FileNotFoundError as e:
+                # Keep the last scan; the directory may be mid-replacement
+                self.log(f"Rescan skipped: {e}", force=True)
+                return set()
+            return known | set(self.source_stats)
+
+        keys = set()
+        for rel in changed:
+            prefix = rel + "/"
+            keys.update(key for key in known if key == rel or key.startswith(prefix))
+            path = self.source_hooks / rel
+            if path.is_dir():
+                keys.update(p.relative_to(self.source_hooks).as_posix()
+                            for p in path.rglob("*.py"))
+            elif rel.endswith(".py"):
+                keys.add(rel)
+
+        for key in keys:
+            try:
+                st = (self.source_hooks / key).stat()
+            except OSError:
+                st = None
+            if st is not None and stat.S_ISREG(st.st_mode):
+                self.source_stats[key] = st
+            else:
+                self.source_stats.pop(key, None)
+        return keys
+
+    def watch(self, preferred_method: str = "auto", debounce: float = 0.2,
+              poll_interval: float = 1.0, force_poll: bool = False, jobs: int = DEFAULT_JOBS):
+        """
+        Watch the source hooks and re-sync changed files to every target
+        synced by sync_many. Bursts of events are debounced, and only the
+        changed files are synced (deletions and renames are propagated).
+        Runs until interrupted.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        watcher = create_watcher(self.source_hooks, poll_interval, force_poll)
+        kind = "inotify" if isinstance(watcher, InotifyWatcher) else "polling"
+        self.log(f"Watching {self.source_hooks} ({kind}), press Ctrl+C to stop", force=True)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+                while True:
+                    changed = watcher.wait(None)
+                    if not changed:
+                        continue
+                    # Keep collecting until the burst goes quiet, but never for
+                    # longer than a few debounce intervals under steady writes
+                    deadline = time.monotonic() + debounce * MAX_BURST_INTERVALS
+                    while True:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        more = watcher.wait(min(debounce, remaining))
+                        if not more:
+                            break
+                        changed |= more
+
+                    keys = self.expand_changes(changed)
+                    if not keys:
+                        continue
+
+                    before = {target: dict(worker.stats)
+                              for target, worker in self.workers.items()}
+                    futures = [pool.submit(worker.sync_paths, target, keys, preferred_method)
+                               for target, worker in self.workers.items()]
+                    for future in futures:
+                        future.result()
+                    burst = new_stats()
+                    for target, worker in self.workers.items():
+                        for name, count in worker.stats.items():
+                            burst[name] += count - before[target][name]
+                    for name, count in burst.items():
+                        self.stats[name] += count
+
+                    self.log(f"{len(keys)} changed file(s) -> {len(self.workers)} target(s): "
+                             f"{sum(burst[RESULT_STATS[r]] for r in SYNCED_RESULTS)} synced, "
+                             f"{burst['removed']} removed, {burst['skipped']} unchanged, "
+                             f"{burst['errors']} errors", force=True)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            watcher.close()
+
+    def total_metrics(self) -> Dict[str, float]:
+        """Metrics of this syncer plus all of its workers (phase times are summed across targets)."""
+        totals = dict(self.metrics)
+        for worker in self.workers.values():
+            for name, value in worker.metrics.items():
+                totals[name] += value
+        return totals
+
+    def stats_document(self, wall_seconds: float) -> dict:
+        """Build the --stats-json document: totals, per-phase timings and per-target detail."""
+        import platform
+        return {
+            "version": STATS_JSON_VERSION,
+            "host": platform.node(),
+            "source": str(self.source_hooks),
+            "wall_seconds": wall_seconds,
+            "stats": self.stats,
+            "metrics": self.total_metrics(),
+            "capabilities": {f"{source}:{target}": capabilities
+                             for (source, target), capabilities in self.capabilities.items()},
+            "targets": {
+                str(target): {"stats": worker.stats, "metrics": worker.metrics}
+                for target, worker in self.workers.items()
+            }
+        }
+
     def print_summary(self):
         """Print sync summary statistics."""
         total = sum(self.stats.values())
+        if len(self.target_stats) > 1:
+            print(f"\nPer-target Summary:")
+            for target, stats in sorted(self.target_stats.items()):
+                status = "✅" if stats["errors"] == 0 else "⚠️ "
+                print(f"  {status} {target}: {stats['symlinked']} symlinked, "
+                      f"{stats['dirs_linked']} directories symlinked, "
+                      f"{stats['hard_linked']} hard linked, "
+                      f"{sum(stats[RESULT_STATS[r]] for r in REFLINK_RESULTS)} reflinked, "
+                      f"{stats['copied']} copied, "
+                      f"{stats['skipped']} skipped, {stats['removed']} removed, "
+                      f"{stats['errors']} errors")
         print(f"\nSync Summary:")
+        if self.target_stats:
+            print(f"  Targets: {len(self.target_stats)}")
         print(f"  Total files processed: {total}")
         print(f"  Symlinked: {self.stats['symlinked']}")
         print(f"  Hard linked: {self.stats['hard_linked']}")
+        if self.stats['dirs_linked']:
+            print(f"  Directories symlinked: {self.stats['dirs_linked']}")
+        reflinked = sum(self.stats[RESULT_STATS[r]] for r in REFLINK_RESULTS)
+        if reflinked:
+            paths = ", ".join(f"{r}: {self.stats[RESULT_STATS[r]]}" for r in REFLINK_RESULTS)
+            print(f"  Reflinked: {reflinked} ({paths})")
         print(f"  Copied: {self.stats['copied']}")
         print(f"  Skipped (already synced): {self.stats['skipped']}")
+        if self.stats['removed']:
+            print(f"  Removed (deleted upstream): {self.stats['removed']}")
         print(f"  Errors: {self.stats['errors']}")
+        metrics = self.total_metrics()
+        print("  Time: " + ", ".join(f"{phase} {metrics[f'{phase}_seconds']:.3f}s"
+                                      for phase in PHASES))
+        print(f"  I/O: {metrics['bytes_hashed']} bytes hashed, "
+              f"{metrics['bytes_copied']} bytes copied, {metrics['entries_scanned']} entries scanned")
         
         if self.stats['errors'] == 0:
             print(f"  ✅ All files synced successfully!")
@@ -262,38 +2082,343 @@ class HookSyncer:
             print(f"  ⚠️  {self.stats['errors']} files failed to sync")
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Sync Claude Code hooks to target project")
-    parser.add_argument("target_path", help="Path to target project directory")
-    parser.add_argument("--method", choices=["auto", "symlink", "hardlink", "copy"], 
-                       default="auto", help="Preferred sync method (default: auto)")
+def read_targets_file(path: Path) -> List[str]:
+    """Read target paths from a file, one per line; blank lines and # comments are ignored."""
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = (line.strip() for line in f)
+        return [line for line in lines if line and not line.startswith("#")]
+
+
+def check_args(argv: List[str]) -> Optional[Tuple[List[str], bool]]:
+    """
+    Recognize a plain "--check [-v] target..." command line without argparse.
+    Returns (target args, verbose), or None if argparse has to parse it.
+    """
+    if "--check" not in argv:
+        return None
+    targets = [arg for arg in argv if arg not in ("--check", "--verbose", "-v")]
+    if not targets or any(arg.startswith("-") for arg in targets):
+        return None
+    return targets, "--verbose" in argv or "-v" in argv
+
+
+def check_targets(syncer: HookSyncer, target_paths: List[Path], verbose: bool = False) -> int:
+    """
+    Report targets whose hooks are out of date. Only the first out-of-date
+    file of each target is listed unless verbose.
+    Returns 0 if every target is up to date, else 1.
+    """
+    try:
+        syncer.get_hook_files()
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        return 1
+
+    up_to_date = True
+    for target_path in target_paths:
+        if not target_path.is_dir():
+            print(f"Error: Target path is not a directory: {target_path}")
+            up_to_date = False
+            continue
+        stale = syncer.check_target(target_path, first_only=not verbose)
+        for target_file, reason in stale:
+            print(f"Out of date: {target_file} ({reason})")
+        if stale:
+            up_to_date = False
+            print(f"Run: python {Path(__file__).resolve()} {target_path}")
+        elif verbose:
+            print(f"✅ Hooks up to date: {target_path}")
+    return 0 if up_to_date else 1
+
+
+def read_bundle_manifest(bundle_path: Path) -> Dict[str, dict]:
+    """Read and validate the file manifest embedded in a bundle."""
+    import zipfile
+    with zipfile.ZipFile(bundle_path) as bundle:
+        document = json.loads(bundle.read(BUNDLE_MANIFEST).decode("utf-8"))
+    if document.get("version") != BUNDLE_VERSION:
+        raise ValueError(f"unsupported bundle version: {document.get('version')}")
+    files = document["files"]
+    for key, entry in files.items():
+        # Never let a bundle write outside the target's hooks directory
+        parts = key.split("/")
+        if key.startswith("/") or "\\" in key or ":" in key or any(part in ("", ".", "..") for part in parts):
+            raise ValueError(f"unsafe path in bundle: {key!r}")
+        if not isinstance(entry.get("size"), int) or not isinstance(entry.get("digest"), str):
+            raise ValueError(f"bad manifest entry for {key!r}")
+    return files
+
+
+def print_plans(syncer: HookSyncer, target_paths: List[Path], args) -> int:
+    """Plan the sync of every target and print the plans as JSON on stdout."""
+    # Keep stdout clean for the JSON document
+    with contextlib.redirect_stdout(sys.stderr):
+        plans = syncer.plan_many(target_paths, args.method, args.jobs, args.link_dirs)
+        if plans is None:
+            return 1
+        for plan in plans:
+            counts = {}
+            for entry in plan["actions"]:
+                counts[entry["action"]] = counts.get(entry["action"], 0) + 1
+            summary = ", ".join(f"{count} {action}" for action, count in sorted(counts.items()))
+            syncer.log(f"Plan for {plan['target']}: {summary or 'nothing to do'}", force=True)
+    json.dump({"version": PLAN_VERSION, "plans": plans}, sys.stdout, indent=2)
+    print()
+    return 0 if len(plans) == len(target_paths) else 1
+
+
+def apply_plan_file(syncer: HookSyncer, args) -> int:
+    """Apply plans saved by --dry-run."""
+    try:
+        if args.apply_plan == "-":
+            document = json.load(sys.stdin)
+        else:
+            with open(args.apply_plan, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+        plans = document["plans"]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Error: Could not read plan: {e}")
+        return 1
+    if document.get("version") != PLAN_VERSION:
+        print(f"Error: Unsupported plan version: {document.get('version')}")
+        return 1
+    
+    try:
+        success = syncer.apply_plans(plans, args.jobs)
+        syncer.print_summary()
+        return 0 if success else 1
+    except Exception as e:
+        print(f"Error applying plan: {e}")
+        if args.verbose:
+            import traceback
+            traceback.print_exc()
+        return 1
+
+
+def store_command(store: HookStore, args) -> int:
+    """Run --store-list or --gc against the store. Returns the exit code."""
+    with store.locked():
+        if args.gc:
+            versions, objects, freed = store.gc(max(0, args.keep_versions))
+            print(f"Removed {versions} versions and {objects} objects ({freed} bytes) from {store.root}")
+        if args.store_list:
+            users: Dict[str, List[str]] = {}
+            for target, version in sorted(store.index["targets"].items()):
+                users.setdefault(version, []).append(target)
+            versions = store.index["versions"]
+            for version in sorted(versions, key=lambda v: versions[v]["created"]):
+                entry = versions[version]
+                created = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry["created"]))
+                print(f"{version}  {created}  {len(entry['files'])} files  {entry['source']}")
+                for target in users.get(version, []):
+                    print(f"    {target}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    # Get source directory (where this script is located)
+    source_root = Path(__file__).parent.resolve()
+
+    # --check runs on every session start, so a plain check skips argparse
+    fast_check = check_args(argv)
+    if fast_check is not None:
+        target_args, verbose = fast_check
+        syncer = HookSyncer(source_root, verbose=verbose)
+        return check_targets(syncer, [Path(target).resolve() for target in target_args], verbose)
+
+    import argparse
+    parser = argparse.ArgumentParser(description="Sync Claude Code hooks to target projects")
+    parser.add_argument("target_paths", nargs="*", metavar="target_path",
+                       help="Path(s) to target project directories")
+    parser.add_argument("--targets-file", 
+                       help="File listing target project paths, one per line")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS,
+                       help=f"Number of targets to sync concurrently (default: {DEFAULT_JOBS})")
+    parser.add_argument("--method", choices=["auto", "symlink", "hardlink", "reflink", "copy", "store"], 
+                       help="Preferred sync method (default: auto)")
+    parser.add_argument("--link-dirs", action="store_true",
+                       help="Symlink whole directories that have no target-local files "
+                            "(symlink and auto methods only)")
+    parser.add_argument("--check", action="store_true",
+                       help="Only report whether targets are up to date (exit code 1 if not), "
+                            "comparing sizes and mtimes; -v lists every out-of-date file")
     parser.add_argument("--dry-run", action="store_true", 
-                       help="Show what would be done without making changes")
+                       help="Print the sync plan as JSON without making changes")
+    parser.add_argument("--apply-plan", metavar="PLAN_FILE",
+                       help="Apply a plan saved from --dry-run ('-' reads stdin)")
     parser.add_argument("--verbose", "-v", action="store_true", 
                        help="Show detailed output")
+    parser.add_argument("--watch", action="store_true",
+                       help="Keep running and re-sync hook files as they change")
+    parser.add_argument("--debounce", type=float, default=0.2,
+                       help="Seconds of quiet before a burst of changes is synced (default: 0.2); "
+                            f"a burst is synced after at most {MAX_BURST_INTERVALS} intervals")
+    parser.add_argument("--poll", action="store_true",
+                       help="Watch by polling file stats instead of using inotify")
+    parser.add_argument("--poll-interval", type=float, default=1.0,
+                       help="Seconds between polls when polling (default: 1.0)")
+    parser.add_argument("--store", metavar="DIR",
+                       help="Content-addressed store used by --method=store "
+                            "(default: $CLAUDE_HOOKS_STORE or ~/.cache/claude-hooks)")
+    parser.add_argument("--store-version", metavar="VERSION",
+                       help="Sync a stored version instead of the current source, to pin or roll back")
+    parser.add_argument("--store-list", action="store_true",
+                       help="List stored versions and the targets using them")
+    parser.add_argument("--gc", action="store_true",
+                       help="Remove stored versions and objects no target uses")
+    parser.add_argument("--keep-versions", type=int, default=1,
+                       help="Unused versions --gc keeps, most recent first (default: 1)")
+    parser.add_argument("--export-bundle", metavar="BUNDLE",
+                       help="Pack the hooks into one compressed bundle file and exit")
+    parser.add_argument("--from-bundle", metavar="BUNDLE",
+                       help="Sync targets from a bundle instead of this repository")
+    parser.add_argument("--stats-json", metavar="FILE",
+                       help="Write per-phase timings, I/O counters and stats as JSON "
+                            "('-' for stdout, moving the text output to stderr)")
+    parser.add_argument("--profile", metavar="FILE",
+                       help="Write a cProfile dump of the run (view with python -m pstats)")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
-    # Get source directory (where this script is located)
-    source_root = Path(__file__).parent.resolve()
-    target_path = Path(args.target_path).resolve()
+    # A saved plan already names its targets and method
+    if args.apply_plan and (args.target_paths or args.targets_file or args.method or args.link_dirs):
+        parser.error("--apply-plan cannot be combined with target paths, --targets-file, "
+                     "--method or --link-dirs; they come from the plan")
+    # Exporting a bundle syncs nothing
+    if args.export_bundle and (args.target_paths or args.targets_file or args.method or args.link_dirs
+                               or args.dry_run or args.watch or args.apply_plan or args.check
+                               or args.from_bundle or args.store_version or args.store_list or args.gc):
+        parser.error("--export-bundle only packs the hooks and cannot be combined with target paths, "
+                     "--targets-file, --method, --link-dirs, --dry-run, --watch, --apply-plan, "
+                     "--check, --from-bundle or the store options")
+    args.method = args.method or "auto"
+    if args.watch and args.dry_run:
+        parser.error("--watch cannot be combined with --dry-run")
+    if args.link_dirs and args.method not in ("auto", "symlink"):
+        parser.error("--link-dirs needs --method=symlink or --method=auto")
+    if args.method == "store" and (args.dry_run or args.watch or args.apply_plan):
+        parser.error("--method=store cannot be combined with --dry-run, --watch or --apply-plan")
+    # --store-list and --gc only touch the store, and --gc has no dry run
+    if (args.store_list or args.gc) and (args.target_paths or args.targets_file or args.dry_run
+                                         or args.watch or args.apply_plan or args.check
+                                         or args.from_bundle or args.store_version):
+        parser.error("--store-list and --gc cannot be combined with target paths, --targets-file, "
+                     "--dry-run, --watch, --apply-plan, --check, --from-bundle or --store-version")
+    if args.from_bundle and (args.dry_run or args.watch or args.apply_plan or args.link_dirs
+                             or args.method not in ("auto", "copy")):
+        parser.error("--from-bundle copies files and cannot be combined with --dry-run, --watch, "
+                     "--apply-plan, --link-dirs or another --method")
+    if args.check and (args.dry_run or args.watch or args.apply_plan):
+        parser.error("--check cannot be combined with --dry-run, --watch or --apply-plan")
+    if args.stats_json == "-" and (args.dry_run or args.check):
+        parser.error("--stats-json=- cannot be combined with --dry-run or --check, "
+                     "which write to stdout; give a file name instead")
+    if args.store_version and args.method != "store":
+        parser.error("--store-version needs --method=store")
     
-    # Validate paths
-    if not target_path.exists():
-        print(f"Error: Target path does not exist: {target_path}")
-        return 1
-        
-    if not target_path.is_dir():
-        print(f"Error: Target path is not a directory: {target_path}")
+    syncer = HookSyncer(source_root, dry_run=args.dry_run, verbose=args.verbose)
+    
+    profiler = None
+    if args.profile:
+        import cProfile
+        syncer.profiles = []
+        profiler = cProfile.Profile()
+        profiler.enable()
+    started = time.perf_counter()
+    # With --stats-json=- stdout carries only the JSON document
+    output = contextlib.redirect_stdout(sys.stderr) if args.stats_json == "-" else contextlib.nullcontext()
+    try:
+        with output:
+            return run(syncer, parser, args)
+    finally:
+        wall_seconds = time.perf_counter() - started
+        if profiler:
+            profiler.disable()
+            write_profile(args.profile, [profiler] + syncer.profiles)
+        if args.stats_json:
+            write_stats_json(args.stats_json, syncer.stats_document(wall_seconds))
+
+
+def write_stats_json(path: str, document: dict):
+    """Write the --stats-json document to a file, or stdout for '-'."""
+    try:
+        if path == "-":
+            json.dump(document, sys.stdout, indent=2)
+            print()
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(document, f, indent=2)
+    except OSError as e:
+        print(f"Error: Could not write stats: {e}")
+
+
+def write_profile(path: str, profiles: List[cProfile.Profile]):
+    """Merge the main and worker thread profiles into one pstats dump."""
+    import pstats
+    try:
+        merged = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            merged.add(profile)
+        merged.dump_stats(path)
+    except (OSError, TypeError) as e:
+        print(f"Error: Could not write profile: {e}")
+
+
+def run(syncer: HookSyncer, parser: argparse.ArgumentParser, args) -> int:
+    """Run the command selected by the parsed arguments. Returns the exit code."""
+    if args.apply_plan:
+        return apply_plan_file(syncer, args)
+    store = HookStore(Path(args.store).expanduser() if args.store else default_store_root())
+    if args.store_list or args.gc:
+        return store_command(store, args)
+    if args.export_bundle:
+        success = syncer.export_bundle(Path(args.export_bundle).resolve())
+        return 0 if success else 1
+    
+    target_args = list(args.target_paths)
+    if args.targets_file:
+        try:
+            target_args.extend(read_targets_file(Path(args.targets_file)))
+        except OSError as e:
+            print(f"Error: Could not read targets file: {e}")
+            return 1
+    if not target_args:
+        parser.error("at least one target_path or --targets-file is required")
+    
+    # Validate paths, keeping each target once
+    target_paths = []
+    invalid = False
+    for target_arg in target_args:
+        target_path = Path(target_arg).resolve()
+        if not target_path.exists():
+            print(f"Error: Target path does not exist: {target_path}")
+            invalid = True
+        elif not target_path.is_dir():
+            print(f"Error: Target path is not a directory: {target_path}")
+            invalid = True
+        elif target_path not in target_paths:
+            target_paths.append(target_path)
+            
+    if not target_paths:
         return 1
     
-    # Create syncer and sync hooks
-    syncer = HookSyncer(source_root, dry_run=args.dry_run, verbose=args.verbose)
+    if args.check:
+        return check_targets(syncer, target_paths, args.verbose) or int(invalid)
+    if args.dry_run:
+        return print_plans(syncer, target_paths, args) or int(invalid)
     
     try:
-        success = syncer.sync_hooks(target_path, args.method)
+        if args.from_bundle:
+            success = syncer.sync_bundle(target_paths, Path(args.from_bundle).resolve(), args.jobs)
+        elif args.method == "store":
+            success = syncer.sync_store(target_paths, store, args.store_version, args.jobs)
+        else:
+            success = syncer.sync_many(target_paths, args.method, args.jobs, args.link_dirs)
+        if args.watch and syncer.workers:
+            syncer.watch(args.method, args.debounce, args.poll_interval, args.poll, args.jobs)
         syncer.print_summary()
-        return 0 if success else 1
+        return 0 if success and not invalid else 1
         
     except Exception as e:
         print(f"Error during sync: {e}")